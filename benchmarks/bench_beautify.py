@@ -0,0 +1,107 @@
+"""
+Benchmark of Beautify: row-wise formatters (previous implementation) vs vectorized formatters.
+
+Usage: python benchmarks/bench_beautify.py [rows]
+"""
+import math
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from tvscreener import StockField, millify, get_recommendation
+from tvscreener.beauty import Beautify, BELOW, CURRENCY_MILLIFY_FROM, CURRENCY_SYMBOLS, FLOAT_SIGNIFICANT_DIGITS
+from tvscreener.field import Rating
+
+
+class RowWiseBeautify(Beautify):
+
+    def _rating(self, column):
+        self.df[column] = self.df[column].apply(lambda x: Rating.find(x).label)
+
+    def _recommendation(self, column, rec_column):
+        self.df[column] = self.df.apply(lambda x: f"{x[column]} - {get_recommendation(x[rec_column])}", axis=1)
+
+    def _number_group(self, column):
+        self.df[column] = self.df[column].apply(lambda x: millify(x))
+
+    def _percent(self, column):
+        self.df[column] = self.df[column].apply(lambda x: f"{x:.2f}%" if x is not None else None)
+
+    def _round(self, column):
+        self.df[column] = self.df[column].apply(lambda x: round(x, 2) if x is not None else None)
+
+    def _to_bool(self, column):
+        self.df[column] = self.df[column].apply(lambda x: True if x == 'true' else False)
+        self.df[column] = self.df[column].astype(bool)
+
+    def _computed_recommendation(self, column, direction, buy_bound, sell_bound):
+        def recommendation(x):
+            value, buy, sell = x[column], bound(buy_bound, x), bound(sell_bound, x)
+            if direction == BELOW:
+                return 'B' if value < buy else 'S' if value > sell else 'N'
+            return 'B' if value > buy else 'S' if value < sell else 'N'
+
+        def bound(value, row):
+            return row[value] if isinstance(value, str) else value
+
+        self.df[column] = self.df.apply(lambda x: f"{x[column]} - {recommendation(x)}", axis=1)
+
+    def _currency(self, column, currency_column):
+        def format_currency(x, currency):
+            if math.isnan(x):
+                return None
+            amount = millify(abs(x)) if abs(x) >= CURRENCY_MILLIFY_FROM else f"{abs(x):.2f}"
+            symbol = CURRENCY_SYMBOLS.get(currency, "") if isinstance(currency, str) else ""
+            code = f" {currency}" if isinstance(currency, str) and not symbol else ""
+            return f"{'-' if math.copysign(1, x) < 0 else ''}{symbol}{amount}{code}"
+
+        currencies = self.df[currency_column] if currency_column is not None else [None] * len(self.df)
+        self.df[column] = [format_currency(x, currency) for x, currency in zip(self.df[column], currencies)]
+
+    def _date(self, column):
+        self.df[column] = self.df[column].apply(lambda x: pd.to_datetime(x, unit="s"))
+
+    def _float(self, column):
+        self.df[column] = self.df[column].apply(lambda x: float(f"{x:.{FLOAT_SIGNIFICANT_DIGITS}g}"))
+
+
+def make_frame(rows):
+    rng = np.random.default_rng(0)
+
+    def values():
+        values_ = rng.lognormal(0, 4, rows) * rng.choice([-1, 1], rows)
+        return np.where(rng.random(rows) < 0.05, np.nan, values_)
+
+    data = {"Symbol": [f"NASDAQ:S{i}" for i in range(rows)]}
+    for field in StockField:
+        if field.format == "bool":
+            data[field.label] = rng.integers(0, 2, rows)
+        elif field.format == "rating":
+            data[field.label] = rng.uniform(-1, 1, rows)
+        elif field.format == "text":
+            data[field.label] = [f"{field.field_name}{i % 100}" for i in range(rows)]
+        elif field.format == "date":
+            data[field.label] = rng.uniform(0, 2e9, rows)
+        else:
+            data[field.label] = values()
+        if field.has_recommendation():
+            data[field.get_rec_label()] = rng.integers(-1, 2, rows).astype(float)
+    data["Currency"] = rng.choice(["USD", "EUR", "CHF", "JPY"], rows)
+    return pd.DataFrame(data)
+
+
+def main(rows=10_000):
+    df = make_frame(rows)
+    # The ratings are categorical in the vectorized result
+    pd.testing.assert_frame_equal(RowWiseBeautify(df, StockField).df, Beautify(df, StockField).df,
+                                  check_dtype=False, check_categorical=False)
+
+    for name, cls in [("rows", RowWiseBeautify), ("columns", Beautify)]:
+        duration = min(timeit.repeat(lambda: cls(df, StockField), number=1, repeat=3))
+        print(f"{name:>8}: {duration * 1000:8.1f} ms for {rows} rows x {len(df.columns)} columns")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,42 @@
+"""
+Benchmark of the decoding of a /scan response into a ScreenerDataFrame: row by row (previous implementation) vs
+column by column.
+
+Usage: python benchmarks/bench_decode.py [rows]
+"""
+import random
+import sys
+import timeit
+
+from tvscreener import ScreenerDataFrame, Screener, StockField, TimeInterval, get_columns_to_request
+
+
+def make_response(columns, rows):
+    random.seed(0)
+    row_values = []
+    for column in columns:
+        if column in ("name", "description", "sector", "industry", "exchange", "type", "country", "currency"):
+            row_values.append(lambda i, column=column: f"{column}{i % 100}")
+        else:
+            row_values.append(lambda i: random.random() * 1000 if random.random() > 0.05 else None)
+    return {"totalCount": rows,
+            "data": [{"s": f"NASDAQ:S{i}", "d": [value(i) for value in row_values]} for i in range(rows)]}
+
+
+def decode_rows(response_json, columns):
+    data = [[d["s"]] + d["d"] for d in response_json['data']]
+    return ScreenerDataFrame(data, columns)
+
+
+def main(rows=10_000):
+    columns = get_columns_to_request(StockField, TimeInterval.ONE_DAY)
+    response_json = make_response(columns, rows)
+    assert decode_rows(response_json, columns).equals(Screener._to_dataframe(response_json, columns))
+
+    for name, fn in [("rows", decode_rows), ("columns", Screener._to_dataframe)]:
+        duration = min(timeit.repeat(lambda: fn(response_json, columns), number=1, repeat=5))
+        print(f"{name:>8}: {duration * 1000:8.1f} ms for {rows} rows x {len(columns)} columns")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
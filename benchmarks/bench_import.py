@@ -0,0 +1,44 @@
+"""
+Benchmark of the import time of the package, each statement being run in a fresh interpreter.
+
+Usage: python benchmarks/bench_import.py [runs]
+"""
+import os
+import subprocess
+import sys
+import time
+
+STATEMENTS = [
+    "import tvscreener",
+    "from tvscreener import StockScreener",
+    "from tvscreener import StockScreener, ScreenerDataFrame",
+    "from tvscreener import *",
+]
+HEAVY_MODULES = ["requests", "numpy", "pandas"]
+
+
+def measure(statement, runs):
+    code = f"{statement}\nimport sys\nprint(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {**os.environ, "PYTHONPATH": root}
+    baseline, duration = [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True, env=env)
+        baseline.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        modules = subprocess.run([sys.executable, "-c", code], check=True, env=env, capture_output=True,
+                                 text=True).stdout.strip()
+        duration.append(time.perf_counter() - start)
+    # The startup of the interpreter itself is not counted
+    return max(min(duration) - min(baseline), 0) * 1000, modules
+
+
+def main(runs=10):
+    for statement in STATEMENTS:
+        duration, modules = measure(statement, runs)
+        print(f"{duration:8.1f} ms  {statement:<56} imports: {modules or '-'}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
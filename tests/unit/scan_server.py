@@ -0,0 +1,93 @@
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class ScanServer:
+    """Local stand-in for the TradingView /scan endpoint."""
+
+    def __init__(self, total_count=500, delay=0.0, status=200):
+        self.total_count = total_count
+        self.delay = delay
+        self.status = status
+        self.payloads = []
+        self.bodies = []  # raw request bodies, as sent on the wire
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._server.server_port}/global/scan"
+
+    @property
+    def request_count(self):
+        return len(self.payloads)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._server.shutdown()
+        self._server.server_close()
+
+    @staticmethod
+    def value(column, index, market=None):
+        if column == "name":
+            return f"S{index}"
+        if column == "description":
+            return f"Stock {index}" if market is None else f"Stock {index} ({market})"
+        if column in ("sector", "industry", "exchange", "type"):
+            return f"{column} {index % 3}"
+        if column.startswith("update_mode"):
+            return "streaming"
+        if column.startswith("Candle."):
+            return index % 2
+        return float(index)
+
+    def respond(self, payload):
+        markets = payload.get("markets") or [None]
+        rows = [(market, i) for market in markets for i in range(self.total_count)]
+        from_range, to_range = payload.get("range") or [0, len(rows)]
+        data = [{"s": f"{market or 'EX'}:S{i}",
+                 "d": [self.value(column, i, market) for column in payload["columns"]]}
+                for market, i in rows[from_range:to_range]]
+        return {"totalCount": len(rows), "data": data}
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_HEAD(self):
+                self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def do_POST(self):
+                raw_body = self.rfile.read(int(self.headers["Content-Length"]))
+                body = gzip.decompress(raw_body) if self.headers.get("Content-Encoding") == "gzip" else raw_body
+                payload = json.loads(body)
+                with server._lock:
+                    server.payloads.append(payload)
+                    server.bodies.append(raw_body)
+                if server.delay:
+                    time.sleep(server.delay)
+                if server.status == 200:
+                    content = json.dumps(server.respond(payload)).encode()
+                else:
+                    content = b'{"error": "Unknown field"}'
+                self.send_response(server.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
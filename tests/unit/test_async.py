@@ -0,0 +1,69 @@
+import asyncio
+import importlib.util
+import unittest
+
+from tvscreener import StockScreener, CryptoScreener, AsyncScreenerSession, ScreenerDataFrame, \
+    MalformedRequestException, gather_screens
+from tests.unit.scan_server import ScanServer
+
+
+@unittest.skipIf(importlib.util.find_spec("aiohttp") is None, "aiohttp is not installed")
+class TestAsync(unittest.TestCase):
+
+    def test_aget(self):
+        with ScanServer(total_count=200) as server:
+            ss = StockScreener()
+            ss.url = server.url
+            df = asyncio.run(ss.aget())
+
+        self.assertIsInstance(df, ScreenerDataFrame)
+        self.assertEqual(150, len(df))
+        self.assertEqual(df.columns[0], "Symbol")
+        self.assertEqual(df.loc[0, "Name"], "S0")
+
+    def test_aget_same_as_get(self):
+        with ScanServer() as server:
+            ss = StockScreener()
+            ss.url = server.url
+            df = ss.get()
+            adf = asyncio.run(ss.aget())
+            self.assertEqual(server.payloads[0], server.payloads[1])
+        self.assertTrue(df.equals(adf))
+
+    def test_aget_malformed_request(self):
+        with ScanServer(status=400) as server:
+            ss = StockScreener()
+            ss.url = server.url
+            with self.assertRaises(MalformedRequestException):
+                asyncio.run(ss.aget())
+
+    def test_aget_unreachable(self):
+        ss = StockScreener()
+        ss.url = "http://127.0.0.1:9/global/scan"
+        with self.assertRaises(MalformedRequestException):
+            asyncio.run(ss.aget())
+
+    def test_gather_screens(self):
+        with ScanServer(total_count=20) as server:
+            screeners = [StockScreener(), CryptoScreener(), StockScreener()]
+            for screener in screeners:
+                screener.url = server.url
+            screeners[2].set_range(0, 5)
+            dfs = asyncio.run(gather_screens(*screeners, limit=2))
+            self.assertEqual(3, server.request_count)
+
+        self.assertEqual([20, 20, 5], [len(df) for df in dfs])
+        self.assertIn("Volume 24h in USD", dfs[1].columns)
+
+    def test_gather_screens_shared_session(self):
+        async def _run(url):
+            async with AsyncScreenerSession(limit=4) as session:
+                self.assertEqual(2, await session.warmup(url, 2))
+                screeners = [StockScreener() for _ in range(6)]
+                for screener in screeners:
+                    screener.url = url
+                return await gather_screens(*screeners, session=session)
+
+        with ScanServer(total_count=10) as server:
+            dfs = asyncio.run(_run(server.url))
+        self.assertEqual(6, len(dfs))
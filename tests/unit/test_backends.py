@@ -0,0 +1,70 @@
+import importlib.util
+import unittest
+
+from tvscreener import StockScreener, StockField, TimeInterval, ResponseCache
+from tvscreener.backends import flatten_label, get_original_columns
+from tests.unit.scan_server import ScanServer
+
+
+class TestBackends(unittest.TestCase):
+
+    def _get(self, **kwargs):
+        with ScanServer(total_count=5) as server:
+            ss = StockScreener()
+            ss.url = server.url
+            ss.select(StockField.PRICE, StockField.SECTOR)
+            df = ss.get(**kwargs)
+            pandas_df = ss.get()
+        return df, pandas_df
+
+    def test_flatten_label(self):
+        self.assertEqual("Price", flatten_label("Price"))
+        self.assertEqual("Price", flatten_label(("Price", "")))
+        self.assertEqual("Relative Strength Index (14)|60", flatten_label(("Relative Strength Index (14)", "60")))
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            StockScreener().get(backend="numpy")
+        with self.assertRaises(ValueError):
+            StockScreener().get(backend="arrow", dtypes="compact")
+
+    @unittest.skipIf(importlib.util.find_spec("pyarrow") is None, "pyarrow is not installed")
+    def test_arrow(self):
+        table, df = self._get(backend="arrow")
+        self.assertEqual(list(df.columns), table.column_names)
+        self.assertEqual(df.attrs['original_columns'], get_original_columns(table))
+        self.assertEqual(df["Price"].tolist(), table.column("Price").to_pylist())
+        self.assertEqual(df["Sector"].tolist(), table.column("Sector").to_pylist())
+
+    @unittest.skipIf(importlib.util.find_spec("pyarrow") is None, "pyarrow is not installed")
+    def test_arrow_time_intervals(self):
+        with ScanServer(total_count=5) as server:
+            ss = StockScreener()
+            ss.url = server.url
+            ss.select(StockField.RELATIVE_STRENGTH_INDEX_14)
+            table = ss.get([TimeInterval.ONE_DAY, TimeInterval.SIXTY_MINUTES], backend="arrow")
+        self.assertIn("Relative Strength Index (14)|60", table.column_names)
+        self.assertIn("Name", table.column_names)
+
+    @unittest.skipIf(importlib.util.find_spec("pyarrow") is None, "pyarrow is not installed")
+    def test_arrow_not_cached(self):
+        with ScanServer(total_count=5) as server:
+            ss = StockScreener()
+            ss.url = server.url
+            ss.set_cache(ResponseCache())
+            ss.get(backend="arrow")
+            ss.get()
+        self.assertEqual(2, server.request_count)
+
+    @unittest.skipIf(importlib.util.find_spec("polars") is None, "polars is not installed")
+    def test_polars(self):
+        pl_df, df = self._get(backend="polars")
+        self.assertEqual(list(df.columns), pl_df.columns)
+        self.assertEqual(df["Price"].tolist(), pl_df["Price"].to_list())
+        self.assertEqual(df["Name"].tolist(), pl_df["Name"].to_list())
+
+    def test_records(self):
+        records, df = self._get(backend="records")
+        self.assertEqual(5, len(records))
+        self.assertEqual(list(df.columns), list(records[0]))
+        self.assertEqual(df.iloc[2].tolist(), list(records[2].values()))
@@ -0,0 +1,230 @@
+import unittest
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from tvscreener import StockScreener, StockField, CryptoField, Field, millify, get_recommendation
+from tvscreener.beauty import beautify, beautify_view, compile_plan, _format_fixed, _millify, _round
+from tvscreener.field import Rating
+from tests.unit.scan_server import ScanServer
+
+
+class _Fields(Field):
+    PRICE = "Price", "close", "round"
+    ODD = "Odd", "odd", "odd_format"
+
+SPECIAL_VALUES = [0.0, -0.0, 0.1, -0.1, 0.5, -0.5, 1.0, -1.0, 0.125, 2.675, 1.005, 0.285, -0.001, 5e-324,
+                  999.9999999999999, 1000.0, 999999.9999, 1e12, 1e15, 1e20, -1e20, 123456.789]
+
+
+def _values():
+    rng = np.random.default_rng(0)
+    values = rng.normal(0, 1, 5000) * 10.0 ** rng.integers(-6, 16, 5000)
+    ties = rng.integers(-2000, 2000, 1000) / 8
+    return np.concatenate([SPECIAL_VALUES, values, ties])
+
+
+class TestBeautify(unittest.TestCase):
+
+    def test_format_fixed(self):
+        values = np.concatenate([_values(), [np.nan, np.inf, -np.inf]])
+        self.assertEqual([f"{x:.2f}%" for x in values.tolist()], list(_format_fixed(values, 2, "%")))
+        self.assertEqual([f"{x:.3f}" for x in values.tolist()], list(_format_fixed(values, 3)))
+
+    def test_round(self):
+        values = np.concatenate([_values(), [np.nan, np.inf]])
+        expected = np.array([round(x, 2) for x in values.tolist()])
+        np.testing.assert_array_equal(expected, _round(values, 2))
+        self.assertTrue(np.signbit(_round(np.array([-0.0, -0.001]), 2)).all())
+
+    def test_millify(self):
+        values = _values()
+        self.assertEqual([millify(x) for x in values.tolist()], list(_millify(values)))
+        with self.assertRaises(ValueError):
+            _millify(np.array([1.0, np.nan]))
+
+    def test_beautify(self):
+        df = pd.DataFrame({
+            "Symbol": ["A", "B", "C", "D"],
+            "All Time High": [1.005, 2.675, np.nan, -3.14159],
+            "Change %": [1.5, -0.001, np.nan, 12.345],
+            "Volume": [np.nan, 1234.0, 5.6e9, -7e12],
+            "Technical Rating": [0.5, 0.1, np.nan, -1.5],
+            "Bull Bear Power": [1.5, np.nan, -2.0, 0.0],
+            "Reco. Bull Bear Power": [1.0, 0.0, -1.0, np.nan],
+            "Candle.Hammer": ["true", 0, 1, None],
+        })
+        result = beautify(df, StockField)
+        self.assertEqual([1.0, 2.67, -1.0, -3.14], result["All Time High"].fillna(-1).tolist())
+        self.assertEqual(["1.50%", "-0.00%", "nan%", "12.35%"], result["Change %"].tolist())
+        self.assertEqual(["0.000", "1.234K", "5.600B", "-7.000T"], result["Volume"].tolist())
+        self.assertEqual(["Strong Buy", "Buy", "Unknown", "Unknown"], result["Technical Rating"].tolist())
+        self.assertEqual(["1.5 - B", "nan - N", "-2.0 - S", "0.0 - B"], result["Bull Bear Power"].tolist())
+        self.assertEqual([True, False, False, False], result["Candle.Hammer"].tolist())
+        # The input frame is left untouched
+        self.assertEqual(1.005, df["All Time High"][0])
+
+    def test_beautify_object_columns(self):
+        df = pd.DataFrame({"Symbol": ["A", "B"], "Change %": [None, 1.5], "Technical Rating": [None, -0.3],
+                           "Bull Bear Power": [1, 2], "Reco. Bull Bear Power": [1, -1]}, dtype=object)
+        result = beautify(df, StockField)
+        self.assertTrue(pd.isna(result["Change %"][0]))
+        self.assertEqual("1.50%", result["Change %"][1])
+        self.assertEqual([Rating.UNKNOWN.label, Rating.SELL.label], result["Technical Rating"].tolist())
+        self.assertEqual([f"1 - {get_recommendation(1)}", f"2 - {get_recommendation(-1)}"],
+                         result["Bull Bear Power"].tolist())
+
+    def test_screener_results(self):
+        with ScanServer(total_count=5) as server:
+            ss = StockScreener()
+            ss.url = server.url
+            ss.select(StockField.BULL_BEAR_POWER, StockField.CHANGE_PERCENT)
+            df = ss.get()
+        result = beautify(df, StockField)
+        # The recommendation column of the results is labeled after the field name
+        self.assertIn("Reco. BBPower", df.columns)
+        self.assertEqual(f"{df['Bull Bear Power'][1]} - B", result["Bull Bear Power"][1])
+        self.assertEqual(f"{df['Change %'][1]:.2f}%", result["Change %"][1])
+
+    def test_plan_cached(self):
+        columns = ("Symbol", "Change %", "Bull Bear Power", "Reco. Bull Bear Power", "Volume")
+        plan = compile_plan(StockField, columns)
+        self.assertIs(plan, compile_plan(StockField, columns))
+        self.assertEqual((("_percent", "Change %"), ("_recommendation", "Bull Bear Power", "Reco. Bull Bear Power"),
+                          ("_replace_nan", "Volume"), ("_number_group", "Volume")), plan)
+        # Without its recommendation column, the field is left as is
+        self.assertEqual((), compile_plan(StockField, ("Bull Bear Power",)))
+
+    def test_currency(self):
+        df = pd.DataFrame({
+            "Price": [182.5, -1.005, np.nan, 2.5e9, 3.0],
+            "Currency": ["USD", "CHF", None, "EUR", None],
+            "Market Capitalization": [2.85e12, 1e5, np.nan, 0.0, 5.0],
+        })
+        result = beautify(df, StockField)
+        self.assertEqual(["$182.50", "-1.00 CHF", "", "€2.500B", "3.00"], result["Price"].fillna("").tolist())
+        self.assertEqual("$2.850T", result["Market Capitalization"][0])
+        self.assertEqual("100000.00 CHF", result["Market Capitalization"][1])
+        # Without the currency column, the amounts have no symbol
+        self.assertEqual(["182.50", "-1.00"], beautify(df[["Price"]].head(2), StockField)["Price"].tolist())
+
+    def test_date(self):
+        df = pd.DataFrame({"Recent Earnings Date": [1700000000.0, np.nan], "Upcoming Earnings Date": [None, 0]},
+                          dtype=object)
+        result = beautify(df, StockField)
+        self.assertEqual(pd.Timestamp("2023-11-14 22:13:20"), result["Recent Earnings Date"][0])
+        self.assertTrue(pd.isna(result["Recent Earnings Date"][1]))
+        self.assertEqual(pd.Timestamp("1970-01-01"), result["Upcoming Earnings Date"][1])
+
+    def test_float_and_text(self):
+        df = pd.DataFrame({"Price": [1.0834567, 0.0000123456789, 65432.1234, np.nan, 0.0],
+                           "Currency": ["USD", None, 1, "BTC", "ETH"]}, dtype=object)
+        result = beautify(df, CryptoField)
+        np.testing.assert_array_equal([1.08346, 1.23457e-05, 65432.1, np.nan, 0.0], result["Price"])
+        self.assertEqual(["USD", "", "1", "BTC", "ETH"], result["Currency"].fillna("").tolist())
+
+    def test_computed_recommendation(self):
+        df = pd.DataFrame({
+            "Price": [10.0, 10.0, 10.0, np.nan],
+            "Simple Moving Average (20)": [9.0, 10.0, 11.0, 5.0],
+            "Relative Strength Index (14)": [25.0, 50.0, 75.0, np.nan],
+            "Average Directional Index (14)": [1.0, 2.0, 3.0, 4.0],
+        })
+        plan = compile_plan(StockField, tuple(df.columns))
+        # The indicators are compared to the price before it is formatted
+        self.assertEqual(("_computed_recommendation", "Simple Moving Average (20)", "below", "Price", "Price"),
+                         plan[0])
+        result = beautify(df, StockField)
+        self.assertEqual(["9.0 - B", "10.0 - N", "11.0 - S", "5.0 - N"], result["Simple Moving Average (20)"].tolist())
+        self.assertEqual(["25.0 - B", "50.0 - N", "75.0 - S", "nan - N"],
+                         result["Relative Strength Index (14)"].tolist())
+        # Without direction, the ADX is left as is
+        self.assertEqual([1.0, 2.0, 3.0, 4.0], result["Average Directional Index (14)"].tolist())
+        # Without the price, the moving averages are left as is
+        self.assertEqual(5.0, beautify(df.drop(columns="Price"), StockField)["Simple Moving Average (20)"][3])
+
+    def test_computed_recommendation_momentum(self):
+        df = pd.DataFrame({
+            "Awesome Oscillator": [5.0, -5.0, 0.0],
+            "Momentum (10)": [2.0, 2.0, -1.0],
+            "Prev. Momentum (10)": [1.0, 3.0, -1.0],
+            "MACD Level (12, 26)": [1.0, -1.0, 0.5],
+            "MACD Signal (12, 26)": [0.5, -0.5, 0.5],
+        })
+        result = beautify(df, StockField)
+        # Without the previous value, positive momentum is a buy
+        self.assertEqual(["5.0 - B", "-5.0 - S", "0.0 - N"], result["Awesome Oscillator"].tolist())
+        # Rising momentum is a buy, falling momentum a sell
+        self.assertEqual(["2.0 - B", "2.0 - S", "-1.0 - N"], result["Momentum (10)"].tolist())
+        # MACD above its signal is a buy
+        self.assertEqual(["1.0 - B", "-1.0 - S", "0.5 - N"], result["MACD Level (12, 26)"].tolist())
+        # Without the signal, positive MACD is a buy
+        self.assertEqual(["1.0 - B", "-1.0 - S", "0.5 - B"],
+                         beautify(df[["MACD Level (12, 26)"]], StockField)["MACD Level (12, 26)"].tolist())
+
+    def test_inplace(self):
+        df = pd.DataFrame({"Symbol": ["A"], "Change %": [1.5]})
+        result = beautify(df, StockField, inplace=True)
+        self.assertIs(df, result)
+        self.assertEqual("1.50%", df["Change %"][0])
+
+    def test_unknown_format(self):
+        df = pd.DataFrame({"Price": [1.234], "Odd": [1.0]})
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            result = beautify(df, _Fields)
+            beautify(df, _Fields)
+        self.assertEqual(1, len(caught))
+        self.assertIn("odd_format", str(caught[0].message))
+        self.assertEqual(1.23, result["Price"][0])
+        self.assertEqual(1.0, result["Odd"][0])
+
+
+class TestBeautifyView(unittest.TestCase):
+
+    def _frame(self, rows=100):
+        return pd.DataFrame({
+            "Symbol": [f"S{i}" for i in range(rows)],
+            "Change %": np.arange(rows) / 10,
+            "Volume": np.arange(rows) * 1000.0,
+            "Technical Rating": np.linspace(-1, 1, rows),
+        })
+
+    def test_untouched(self):
+        df = self._frame()
+        expected = df.copy()
+        view = beautify_view(df, StockField, max_rows=5)
+        text = repr(view)
+        self.assertIn("1.000K", text)
+        self.assertIn("0.40%", text)
+        self.assertNotIn("0.50%", text)
+        self.assertTrue(text.endswith("[100 rows x 4 columns]"))
+        self.assertIn("[100 rows x 4 columns]", view._repr_html_())
+        pd.testing.assert_frame_equal(expected, df)
+        self.assertIs(df, view.df)
+        self.assertEqual(100, len(view))
+
+    def test_head(self):
+        view = beautify_view(self._frame(), StockField)
+        head = view.head(3)
+        self.assertEqual(["0.00%", "0.10%", "0.20%"], head["Change %"].tolist())
+        self.assertEqual(50, len(view.head()))
+        # All the rows are rendered: no dimensions, as in pandas
+        self.assertNotIn("rows x", repr(beautify_view(self._frame(3), StockField)))
+
+    def test_displayed_columns(self):
+        view = beautify_view(self._frame(), StockField)
+        with pd.option_context("display.max_columns", 2):
+            rendered = view._render()
+        # Only the first and last columns are displayed, and formatted
+        self.assertEqual(1000.0, rendered["Volume"][1])
+        self.assertEqual("Strong Sell", rendered["Technical Rating"][0])
+
+    def test_max_rows(self):
+        with self.assertRaises(ValueError):
+            beautify_view(self._frame(), StockField, max_rows=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,300 @@
+import multiprocessing
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from tvscreener import StockScreener, ResponseCache, DiskCache, BarExpiry, TimeInterval, ScreenerDataFrame
+from tvscreener.cache import make_key, next_bar_boundary, get_update_delay, get_session_offset
+from tests.unit.scan_server import ScanServer
+
+
+def _frame(rows=10):
+    return pd.DataFrame({"Symbol": [f"S{i}" for i in range(rows)], "Price": [float(i) for i in range(rows)]})
+
+
+def _fill_disk_cache(path, worker):
+    cache = DiskCache(path)
+    for i in range(20):
+        cache.set(f"{worker}-{i}", _frame(i + 1))
+        cache.get(f"{worker}-{i // 2}")
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def test_make_key_canonical(self):
+        self.assertEqual(make_key("url", {"a": 1, "b": [1, 2]}), make_key("url", {"b": [1, 2], "a": 1}))
+        # Serialized payloads are hashed as is
+        self.assertEqual(make_key("url", '{"a":1}'), make_key("url", b'{"a":1}'))
+        self.assertNotEqual(make_key("url", '{"a":1}'), make_key("url", '{"a": 1}'))
+        self.assertNotEqual(make_key("url", {"a": 1}), make_key("other", {"a": 1}))
+        self.assertNotEqual(make_key("url", {"a": 1}), make_key("url", {"a": 2}))
+
+    def test_hit_miss(self):
+        cache = ResponseCache()
+        self.assertIsNone(cache.get("key"))
+        cache.set("key", _frame())
+        self.assertTrue(_frame().equals(cache.get("key")))
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(1, cache.misses)
+
+    def test_copy(self):
+        cache = ResponseCache()
+        df = _frame()
+        cache.set("key", df)
+        df.loc[0, "Price"] = 100.0
+        cached = cache.get("key")
+        cached.loc[1, "Price"] = 100.0
+        self.assertTrue(_frame().equals(cache.get("key")))
+
+    def test_copy_old_pandas(self):
+        # Before pandas 1.5, the copy-on-write option does not exist: deep copy
+        def get_option(name):
+            raise pd.errors.OptionError(f"No such keys(s): '{name}'")
+
+        cache = ResponseCache()
+        cache.set("key", _frame())
+        with mock.patch.object(pd, "__version__", "1.4.4"), mock.patch.object(pd, "get_option", get_option):
+            cached = cache.get("key")
+        cached.loc[1, "Price"] = 100.0
+        self.assertTrue(_frame().equals(cache.get("key")))
+
+    def test_ttl(self):
+        cache = ResponseCache(ttl=0.05)
+        cache.set("key", _frame())
+        cache.set("no_ttl", _frame(), ttl=0)
+        self.assertIsNotNone(cache.get("key"))
+        self.assertIsNone(cache.get("no_ttl"))
+        time.sleep(0.1)
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.size_bytes)
+
+    def test_lru_max_entries(self):
+        cache = ResponseCache(max_entries=2)
+        cache.set("a", _frame())
+        cache.set("b", _frame())
+        cache.get("a")
+        cache.set("c", _frame())
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("c"))
+        self.assertEqual(1, cache.evictions)
+
+    def test_lru_max_bytes(self):
+        size = int(_frame(100).memory_usage(deep=True).sum())
+        cache = ResponseCache(max_bytes=int(size * 2.5))
+        for key in "abc":
+            cache.set(key, _frame(100))
+        self.assertEqual(2, len(cache))
+        self.assertIsNone(cache.get("a"))
+        self.assertLessEqual(cache.size_bytes, cache.max_bytes)
+        cache.set("big", _frame(1000))
+        self.assertIsNone(cache.get("big"))
+
+    def test_stats(self):
+        cache = ResponseCache()
+        cache.set("a", _frame())
+        cache.get("a")
+        cache.get("b")
+        stats = cache.stats()
+        self.assertEqual(1, stats["hits"])
+        self.assertEqual(1, stats["misses"])
+        self.assertEqual(1, stats["entries"])
+
+    def test_screener_cache(self):
+        with ScanServer(total_count=10) as server:
+            cache = ResponseCache()
+            ss = StockScreener()
+            ss.url = server.url
+            ss.set_cache(cache)
+            df = ss.get()
+            cached = ss.get()
+            self.assertEqual(1, server.request_count)
+            self.assertTrue(df.equals(cached))
+
+            ss.set_range(0, 5)
+            self.assertEqual(5, len(ss.get()))
+            self.assertEqual(2, server.request_count)
+            self.assertEqual(1, cache.hits)
+            self.assertEqual(2, cache.misses)
+
+    def test_screener_cache_key(self):
+        ss = StockScreener()
+        ss.set_cache(ResponseCache())
+        payload_json = ss._prepare_request(TimeInterval.ONE_DAY)[1]
+        cache_key = ss._cache_get(payload_json)[0]
+        self.assertEqual(make_key(ss.url, payload_json), cache_key)
+        # Memoized with the payload
+        self.assertIs(cache_key, ss._cache_get(ss._prepare_request(TimeInterval.ONE_DAY)[1])[0])
+        ss.set_range(0, 5)
+        self.assertNotEqual(cache_key, ss._cache_get(ss._prepare_request(TimeInterval.ONE_DAY)[1])[0])
+
+
+class TestBarExpiry(unittest.TestCase):
+    # 2024-01-03 (Wednesday) 10:07:30 UTC
+    NOW = 1704276450.0
+
+    def test_next_bar_boundary(self):
+        self.assertEqual(self.NOW + 30, next_bar_boundary(TimeInterval.ONE_MINUTE, self.NOW))
+        self.assertEqual(self.NOW + 7 * 60 + 30, next_bar_boundary(TimeInterval.FIFTEEN_MINUTES, self.NOW))
+        self.assertEqual(self.NOW + 52 * 60 + 30, next_bar_boundary(TimeInterval.SIXTY_MINUTES, self.NOW))
+        # 2024-01-04 00:00 UTC
+        self.assertEqual(1704326400, next_bar_boundary(TimeInterval.ONE_DAY, self.NOW))
+        # 2024-01-08 (Monday) 00:00 UTC
+        self.assertEqual(1704672000, next_bar_boundary(TimeInterval.ONE_WEEK, self.NOW))
+
+    def test_next_bar_boundary_on_boundary(self):
+        self.assertEqual(1704326400 + 24 * 60 * 60, next_bar_boundary(TimeInterval.ONE_DAY, 1704326400))
+
+    def test_ttl(self):
+        expiry = BarExpiry(slack=5)
+        self.assertEqual(35, expiry(TimeInterval.ONE_MINUTE, now=self.NOW))
+        self.assertEqual(1704326400 - self.NOW + 5, expiry(TimeInterval.ONE_DAY, now=self.NOW))
+
+    def test_next_bar_boundary_session(self):
+        # 13:30 UTC: 9:30 in New York in summer
+        offset = 13 * 3600 + 30 * 60
+        # 10:07:30 UTC is in the 9:30 - 10:30 bar
+        self.assertEqual(self.NOW + 22 * 60 + 30, next_bar_boundary(TimeInterval.SIXTY_MINUTES, self.NOW, offset))
+        self.assertEqual(self.NOW + 7 * 60 + 30, next_bar_boundary(TimeInterval.FIFTEEN_MINUTES, self.NOW, offset))
+        # 2024-01-03 13:30 UTC
+        self.assertEqual(1704288600, next_bar_boundary(TimeInterval.ONE_DAY, self.NOW, offset))
+        # 2024-01-08 (Monday) 13:30 UTC
+        self.assertEqual(1704672000 + offset, next_bar_boundary(TimeInterval.ONE_WEEK, self.NOW, offset))
+
+    def test_session_offset(self):
+        session = ("09:30", "America/New_York")
+        # 14:30 UTC in winter, 13:30 UTC in summer
+        self.assertEqual(14 * 3600 + 30 * 60, get_session_offset(session, self.NOW))
+        self.assertEqual(13 * 3600 + 30 * 60, get_session_offset(session, self.NOW + 180 * 24 * 3600))
+
+    def test_ttl_session(self):
+        # 2024-01-03 15:05 UTC, 10:05 in New York: the 60 minute bar closes at 10:30, not at 11:00
+        now = 1704294300.0
+        self.assertEqual(25 * 60, BarExpiry(slack=0, session=("09:30", "America/New_York"))(
+            TimeInterval.SIXTY_MINUTES, now=now))
+        self.assertEqual(55 * 60, BarExpiry(slack=0)(TimeInterval.SIXTY_MINUTES, now=now))
+        with self.assertRaises(ValueError):
+            BarExpiry(session=("9h30", "America/New_York"))
+
+    def test_ttl_max(self):
+        expiry = BarExpiry(slack=0, max_ttl=600)
+        self.assertEqual(600, expiry(TimeInterval.ONE_DAY, now=self.NOW))
+
+    def test_ttl_multiple_intervals(self):
+        expiry = BarExpiry(slack=0)
+        self.assertEqual(150, expiry([TimeInterval.ONE_DAY, TimeInterval.FIVE_MINUTES], now=self.NOW))
+
+    def test_ttl_delayed_data(self):
+        expiry = BarExpiry(slack=0)
+        df = pd.DataFrame({"Update Mode": ["delayed_streaming_900", "streaming", None]})
+        self.assertEqual(900, get_update_delay(df))
+        # The delayed 15 minute bar shown at 10:07:30 is the 09:45 one, replaced at 10:00 + 15 minutes
+        self.assertEqual(7 * 60 + 30, expiry(TimeInterval.FIFTEEN_MINUTES, df, now=self.NOW))
+
+    def test_cache_with_expiry(self):
+        cache = ResponseCache(ttl=BarExpiry(slack=0, max_ttl=0.05))
+        cache.set("key", _frame(), time_interval=TimeInterval.ONE_DAY)
+        self.assertIsNotNone(cache.get("key"))
+        time.sleep(0.1)
+        self.assertIsNone(cache.get("key"))
+
+
+class TestDiskCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cache", "responses.sqlite")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_hit_miss(self):
+        cache = DiskCache(self.path)
+        self.assertIsNone(cache.get("key"))
+        cache.set("key", _frame())
+        self.assertTrue(_frame().equals(cache.get("key")))
+        self.assertEqual({"hits": 1, "misses": 1, "entries": 1}, {k: v for k, v in cache.stats().items()
+                                                                  if k != "size_bytes"})
+
+    def test_shared_between_instances(self):
+        DiskCache(self.path).set("key", _frame())
+        self.assertIsNotNone(DiskCache(self.path).get("key"))
+
+    def test_screener_dataframe(self):
+        df = ScreenerDataFrame([["NASDAQ:AAPL", "AAPL", "Apple Inc.", 1.0]],
+                               {"name": "Name", "description": "Description", "close": "Price"})
+        cache = DiskCache(self.path)
+        cache.set("key", df)
+        cached = cache.get("key")
+        self.assertIsInstance(cached, ScreenerDataFrame)
+        self.assertTrue(df.equals(cached))
+        self.assertEqual(df.attrs, cached.attrs)
+
+    def test_ttl(self):
+        cache = DiskCache(self.path, ttl=0.05)
+        cache.set("key", _frame())
+        self.assertIsNotNone(cache.get("key"))
+        time.sleep(0.1)
+        self.assertIsNone(cache.get("key"))
+        cache.set("other", _frame())
+        self.assertEqual(1, len(cache))
+
+    def test_max_bytes(self):
+        cache = DiskCache(self.path)
+        cache.set("a", _frame(1000))
+        size = cache.stats()["size_bytes"]
+        cache.clear()
+
+        cache = DiskCache(self.path, max_bytes=int(size * 2.5))
+        for key in "abc":
+            cache.set(key, _frame(1000))
+            time.sleep(0.01)
+        self.assertEqual(2, len(cache))
+        self.assertIsNone(cache.get("a"))
+        self.assertLessEqual(cache.stats()["size_bytes"], cache.max_bytes)
+
+    def test_lru(self):
+        cache = DiskCache(self.path)
+        cache.set("a", _frame(1000))
+        size = cache.stats()["size_bytes"]
+        cache.max_bytes = int(size * 2.5)
+        time.sleep(0.01)
+        cache.set("b", _frame(1000))
+        time.sleep(0.01)
+        cache.get("a")
+        time.sleep(0.01)
+        cache.set("c", _frame(1000))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+
+    def test_multiple_processes(self):
+        DiskCache(self.path)
+        processes = [multiprocessing.Process(target=_fill_disk_cache, args=(self.path, worker)) for worker in range(4)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        self.assertEqual([0] * 4, [process.exitcode for process in processes])
+
+        cache = DiskCache(self.path)
+        self.assertEqual(80, len(cache))
+        self.assertEqual(20, len(cache.get("3-19")))
+
+    def test_screener_cache(self):
+        with ScanServer(total_count=10) as server:
+            ss = StockScreener()
+            ss.url = server.url
+            ss.set_cache(DiskCache(self.path))
+            df = ss.get()
+
+            other = StockScreener()
+            other.url = server.url
+            other.set_cache(DiskCache(self.path))
+            cached = other.get()
+            self.assertEqual(1, server.request_count)
+        self.assertTrue(df.equals(cached))
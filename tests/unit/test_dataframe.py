@@ -0,0 +1,54 @@
+import pickle
+import unittest
+
+from tvscreener import ScreenerDataFrame
+
+COLUMNS = {"close": "Price", "name": "Name", "description": "Description", "volume": "Volume"}
+
+
+class TestScreenerDataFrame(unittest.TestCase):
+
+    def _build(self):
+        data = {"symbol": ["EX:A", "EX:B"], "close": [1.5, 2.5], "name": ["A", "B"],
+                "description": ["Stock A", "Stock B"], "volume": [10.0, 20.0]}
+        return ScreenerDataFrame(data, COLUMNS)
+
+    def test_column_order(self):
+        df = self._build()
+        self.assertEqual(["Symbol", "Name", "Description", "Price", "Volume"], list(df.columns))
+        self.assertEqual(["symbol", "name", "description", "close", "volume"], list(df.attrs['original_columns']))
+        self.assertEqual([1.5, 2.5], df["Price"].tolist())
+
+    def test_rows(self):
+        df = ScreenerDataFrame([["EX:A", 1.5, "A", "Stock A", 10.0]], COLUMNS)
+        self.assertEqual(["EX:A", "A", "Stock A", 1.5, 10.0], df.iloc[0].tolist())
+
+    def test_rows_empty(self):
+        df = ScreenerDataFrame([], COLUMNS)
+        self.assertEqual(5, len(df.columns))
+        self.assertEqual(0, len(df))
+
+    def test_derived_frames(self):
+        df = self._build()
+        for derived in [df.head(1), df[["Name", "Price"]], df.sort_values("Price"), df.astype({"Price": "float32"}),
+                        df.copy(deep=False), pickle.loads(pickle.dumps(df))]:
+            self.assertIsInstance(derived, ScreenerDataFrame)
+            self.assertEqual(df.attrs, derived.attrs)
+
+    def test_derived_frames_reshaped(self):
+        df = self._build()
+        numbers = df[["Price", "Volume"]]
+        self.assertEqual(["EX:A", "EX:B"], df.T.loc["Symbol"].tolist())
+        self.assertEqual((2, 2), numbers.corr().shape)
+        self.assertEqual((2, 2), numbers.cov().shape)
+        self.assertEqual([[8.5, 65.0], [65.0, 500.0]], numbers.T.dot(numbers).values.tolist())
+        self.assertEqual([10.0, 20.0], df.pivot_table(index="Name", values="Volume")["Volume"].tolist())
+        self.assertEqual([11.5, 22.5], numbers.apply(lambda row: row.sum(), axis=1).tolist())
+        self.assertEqual(["A", "B"], df.apply(lambda row: row["Name"], axis=1).tolist())
+
+    def test_technical_columns_selection(self):
+        df = self._build()[["Name", "Price"]]
+        df.set_technical_columns(only=True)
+        self.assertEqual(["name", "close"], list(df.columns))
+        df.set_technical_columns()
+        self.assertEqual([("name", "Name"), ("close", "Price")], list(df.columns))
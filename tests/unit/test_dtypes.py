@@ -0,0 +1,51 @@
+import unittest
+
+from tvscreener import StockScreener, StockField, TimeInterval
+from tvscreener.util import get_field_by_column
+from tests.unit.scan_server import ScanServer
+
+
+class TestDtypes(unittest.TestCase):
+
+    def test_field_by_column(self):
+        self.assertEqual(StockField.RELATIVE_STRENGTH_INDEX_14, get_field_by_column(StockField, "RSI|60"))
+        self.assertEqual(StockField.RELATIVE_STRENGTH_INDEX_14, get_field_by_column(StockField, "Rec.RSI"))
+        self.assertEqual(StockField.RELATIVE_STRENGTH_INDEX_14, get_field_by_column(StockField, "RSI[1]|60"))
+        self.assertEqual(StockField.CHANGE_1W_PERCENT, get_field_by_column(StockField, "change|1W"))
+        self.assertIsNone(get_field_by_column(StockField, "update_mode|60"))
+
+    def test_compact(self):
+        with ScanServer(total_count=2000) as server:
+            ss = StockScreener()
+            ss.url = server.url
+            ss.set_range(0, 2000)
+            df = ss.get()
+            df_compact = ss.get(dtypes="compact")
+
+        self.assertIn("set_technical_columns", dir(df_compact))
+        self.assertEqual(df.attrs, df_compact.attrs)
+        self.assertEqual("float32", df_compact["Relative Strength Index (14)"].dtype)
+        self.assertEqual("float64", df_compact["Volume"].dtype)
+        self.assertEqual("boolean", df_compact["Candle.Doji"].dtype)
+        self.assertEqual("category", df_compact["Sector"].dtype)
+        self.assertEqual("string", df_compact["Name"].dtype.name.split("[")[0])
+        self.assertEqual(df["Name"].tolist(), df_compact["Name"].tolist())
+        self.assertEqual([False, True], df_compact["Candle.Doji"].tolist()[:2])
+        self.assertEqual(["sector 0", "sector 1"], df_compact["Sector"].tolist()[:2])
+        self.assertLess(df_compact.memory_usage(deep=True).sum(), df.memory_usage(deep=True).sum() * 0.6)
+
+    def test_compact_time_intervals(self):
+        with ScanServer(total_count=5) as server:
+            ss = StockScreener()
+            ss.url = server.url
+            ss.select(StockField.RELATIVE_STRENGTH_INDEX_14)
+            df = ss.get([TimeInterval.ONE_DAY, TimeInterval.SIXTY_MINUTES], dtypes="compact")
+        self.assertEqual("float32", df[("Relative Strength Index (14)", "60")].dtype)
+        self.assertEqual("category", df[("Update Mode", "60")].dtype)
+
+    def test_unknown_dtypes(self):
+        with ScanServer(total_count=5) as server:
+            ss = StockScreener()
+            ss.url = server.url
+            with self.assertRaises(ValueError):
+                ss.get(dtypes="small")
@@ -0,0 +1,98 @@
+import asyncio
+import unittest
+
+from tvscreener import StockScreener, ScreenerDataFrame, ResponseCache, AsyncScreenerSession
+from tvscreener.field import Market
+from tests.unit.scan_server import ScanServer
+
+
+class TestFanOut(unittest.TestCase):
+
+    def test_set_markets_fan_out(self):
+        ss = StockScreener()
+        self.assertFalse(ss.fan_out)
+        ss.set_markets(Market.JAPAN, Market.FRANCE, fan_out=True)
+        self.assertTrue(ss.fan_out)
+        self.assertEqual([Market.JAPAN, Market.FRANCE], ss.markets)
+
+    def test_fan_out(self):
+        with ScanServer(total_count=10) as server:
+            ss = StockScreener()
+            ss.url = server.url
+            ss.set_markets(Market.JAPAN, Market.FRANCE, Market.UK, fan_out=True)
+            df = ss.get()
+            markets = sorted(payload["markets"] for payload in server.payloads)
+
+        self.assertIsInstance(df, ScreenerDataFrame)
+        self.assertEqual([["france"], ["japan"], ["uk"]], markets)
+        self.assertEqual(30, len(df))
+        self.assertEqual(["japan"] * 10 + ["france"] * 10 + ["uk"] * 10, list(df["Market"]))
+        self.assertEqual("france:S0", df.loc[10, "Symbol"])
+        self.assertEqual(df.columns[0], "Symbol")
+        self.assertEqual(df.columns[-1], "Market")
+
+    def test_fan_out_all(self):
+        with ScanServer(total_count=1) as server:
+            ss = StockScreener()
+            ss.url = server.url
+            ss.set_markets(Market.ALL, fan_out=True)
+            df = ss.get()
+            self.assertEqual(len(Market) - 1, server.request_count)
+        self.assertNotIn("ALL", list(df["Market"]))
+
+    def test_fan_out_cache(self):
+        with ScanServer(total_count=10) as server:
+            cache = ResponseCache()
+            ss = StockScreener()
+            ss.url = server.url
+            ss.set_cache(cache)
+            ss.set_markets(Market.JAPAN, Market.FRANCE, fan_out=True)
+            df = ss.get()
+            cached = ss.get()
+            self.assertEqual(2, server.request_count)
+            self.assertTrue(df.equals(cached))
+            self.assertEqual({"hits": 1, "misses": 1, "entries": 1},
+                             {k: v for k, v in cache.stats().items() if k in ("hits", "misses", "entries")})
+
+            ss.set_markets(Market.JAPAN, Market.UK, fan_out=True)
+            self.assertEqual(["japan"] * 10 + ["uk"] * 10, list(ss.get()["Market"]))
+            self.assertEqual(4, server.request_count)
+
+    def test_fan_out_async(self):
+        async def _aget(ss):
+            async with AsyncScreenerSession() as session:
+                return await ss.aget(session=session), await ss.aget()
+
+        with ScanServer(total_count=10) as server:
+            ss = StockScreener()
+            ss.url = server.url
+            ss.set_markets(Market.JAPAN, Market.FRANCE, Market.UK, fan_out=True)
+            expected = ss.get()
+            df, other = asyncio.run(_aget(ss))
+            self.assertEqual(9, server.request_count)
+            self.assertEqual([["france"], ["japan"], ["uk"]], sorted(payload["markets"] for payload in server.payloads[3:6]))
+        self.assertTrue(expected.equals(df))
+        self.assertTrue(expected.equals(other))
+
+    def test_fan_out_paginated(self):
+        ss = StockScreener()
+        ss.set_markets(Market.JAPAN, Market.FRANCE, fan_out=True)
+        with self.assertRaises(ValueError):
+            ss.get_all()
+        with self.assertRaises(ValueError):
+            ss.iter_pages()
+        with self.assertRaises(ValueError):
+            ss.aiter_pages()
+        # A single market is not fanned out
+        ss.set_markets(Market.JAPAN, fan_out=True)
+        ss.iter_pages()
+
+    def test_no_fan_out(self):
+        with ScanServer(total_count=10) as server:
+            ss = StockScreener()
+            ss.url = server.url
+            ss.set_markets(Market.JAPAN, Market.FRANCE)
+            df = ss.get()
+            self.assertEqual(1, server.request_count)
+            self.assertEqual(["japan", "france"], server.payloads[0]["markets"])
+        self.assertNotIn("Market", df.columns)
@@ -1,6 +1,10 @@
 import unittest
 
+import numpy as np
+import pandas as pd
+
 from tvscreener import StockField
+from tvscreener.field import Rating, _get_indexes
 
 
 class TestFields(unittest.TestCase):
@@ -34,3 +38,46 @@ class TestFields(unittest.TestCase):
 
     def test_get_by_label(self):
         self.assertEqual(StockField.VOLUME, StockField.get_by_label(StockField, StockField.VOLUME.label))
+
+    def test_from_label(self):
+        for field in StockField:
+            self.assertEqual(next(f for f in StockField if f.label == field.label), StockField.from_label(field.label))
+        self.assertIsNone(StockField.from_label("Unknown label"))
+
+    def test_from_field_name(self):
+        self.assertEqual(StockField.RELATIVE_STRENGTH_INDEX_14, StockField.from_field_name("RSI"))
+        self.assertEqual(StockField.RELATIVE_STRENGTH_INDEX_14, StockField.from_field_name("RSI|60"))
+        self.assertEqual(StockField.RELATIVE_STRENGTH_INDEX_14, StockField.from_field_name("Rec.RSI|60"))
+        self.assertEqual(StockField.RELATIVE_STRENGTH_INDEX_14, StockField.from_field_name("RSI[1]"))
+        self.assertEqual(StockField.CHANGE_1W_PERCENT, StockField.from_field_name("change|1W"))
+        self.assertIsNone(StockField.from_field_name("update_mode|60"))
+        # The prefix and suffix of a column matching no field
+        self.assertIsNone(StockField.from_field_name("Rec.Unknown|60"))
+        self.assertIsNone(StockField.from_field_name("Unknown[1]"))
+        # Memoized, misses included
+        memo = _get_indexes(StockField)[3]
+        self.assertIs(StockField.RELATIVE_STRENGTH_INDEX_14, memo["Rec.RSI|60"])
+        self.assertIn("Unknown[1]", memo)
+        self.assertIsNone(memo["Unknown[1]"])
+
+    def test_from_format(self):
+        self.assertEqual(tuple(f for f in StockField if f.format == "percent"), StockField.from_format("percent"))
+        self.assertIn(StockField.BULL_BEAR_POWER, StockField.from_format("recommendation"))
+        self.assertEqual((), StockField.from_format("unknown"))
+
+
+class TestRating(unittest.TestCase):
+
+    def test_classify(self):
+        values = np.concatenate([np.linspace(-1.2, 1.2, 241), [np.nan, -1, -0.5, -0.1, 0.1, 0.5, 1]])
+        categorical = Rating.classify(values)
+        self.assertEqual([Rating.find(value).label for value in values.tolist()], list(categorical))
+        self.assertEqual([rating.label for rating in Rating], list(categorical.categories))
+
+    def test_classify_series(self):
+        series = pd.Series([0.7, None, -0.3], index=[3, 4, 5], name="Technical Rating", dtype=object)
+        result = Rating.classify(series)
+        self.assertEqual("category", result.dtype)
+        self.assertEqual([3, 4, 5], list(result.index))
+        self.assertEqual("Technical Rating", result.name)
+        self.assertEqual(["Strong Buy", "Unknown", "Sell"], result.tolist())
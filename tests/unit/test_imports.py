@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import tvscreener
+from tests.unit.scan_server import ScanServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def run(code, *options):
+    env = {**os.environ, "PYTHONPATH": ROOT}
+    return subprocess.run([sys.executable, *options, "-c", code], check=True, env=env, capture_output=True,
+                          text=True).stdout.strip()
+
+
+class TestImports(unittest.TestCase):
+
+    def test_import_is_lazy(self):
+        modules = run("import sys, tvscreener\n"
+                      "print(sorted(m for m in ('pandas', 'numpy', 'requests', 'tvscreener.field') "
+                      "if m in sys.modules))")
+        self.assertEqual("[]", modules)
+
+    def test_isolated_mode(self):
+        # Without site nor PYTHONPATH, importlib.util is not imported by the interpreter startup
+        output = run(f"import sys\nsys.path.insert(0, {ROOT!r})\nimport tvscreener\nprint(tvscreener.millify(1234))",
+                     "-S", "-I")
+        self.assertEqual("1.234K", output)
+
+    def test_records_without_pandas(self):
+        with ScanServer(total_count=3) as server:
+            output = run("import sys\n"
+                         "from tvscreener import StockScreener\n"
+                         "ss = StockScreener()\n"
+                         f"ss.url = {server.url!r}\n"
+                         "records = ss.get(backend='records')\n"
+                         "print(len(records), records[1]['Symbol'], records[1]['Name'], "
+                         "'pandas' in sys.modules, 'numpy' in sys.modules)")
+        self.assertEqual("3 america:S1 S1 False False", output)
+
+    def test_lazy_attributes(self):
+        for name in tvscreener.__all__:
+            self.assertIsNotNone(getattr(tvscreener, name))
+        self.assertIs(tvscreener.millify, tvscreener.util.millify)
+        self.assertIs(tvscreener.Rating, tvscreener.field.Rating)
+        self.assertIn("StockScreener", dir(tvscreener))
+        with self.assertRaises(AttributeError):
+            tvscreener.UnknownScreener
@@ -0,0 +1,117 @@
+import asyncio
+import importlib.util
+import unittest
+
+import pandas as pd
+
+from tvscreener import StockScreener, Screener, ScreenerDataFrame, MalformedRequestException
+from tests.unit.scan_server import ScanServer
+
+
+class TestPagination(unittest.TestCase):
+
+    def test_windows(self):
+        self.assertEqual([(0, 100), (100, 200), (200, 250)], Screener._get_windows(250, 100))
+        self.assertEqual([(100, 200), (200, 250)], Screener._get_windows(250, 100, start=100))
+        self.assertEqual([], Screener._get_windows(80, 100, start=100))
+
+    def test_get_all(self):
+        with ScanServer(total_count=1234) as server:
+            ss = StockScreener()
+            ss.url = server.url
+            df = ss.get_all(page_size=100, max_workers=4)
+            ranges = sorted(payload["range"] for payload in server.payloads)
+
+        self.assertIsInstance(df, ScreenerDataFrame)
+        self.assertEqual(1234, len(df))
+        self.assertEqual([f"america:S{i}" for i in range(1234)], list(df["Symbol"]))
+        self.assertEqual(13, len(ranges))
+        self.assertEqual([0, 100], ranges[0])
+        self.assertEqual([1200, 1234], ranges[-1])
+        # The range set on the screener is left untouched
+        self.assertEqual([0, 150], ss.range)
+
+    def test_get_all_single_page(self):
+        with ScanServer(total_count=42) as server:
+            ss = StockScreener()
+            ss.url = server.url
+            df = ss.get_all(page_size=100)
+            self.assertEqual(1, server.request_count)
+        self.assertEqual(42, len(df))
+
+    def test_get_all_malformed_request(self):
+        with ScanServer(status=400) as server:
+            ss = StockScreener()
+            ss.url = server.url
+            with self.assertRaises(MalformedRequestException):
+                ss.get_all()
+
+    def test_iter_pages(self):
+        with ScanServer(total_count=250) as server:
+            ss = StockScreener()
+            ss.url = server.url
+            pages = list(ss.iter_pages(page_size=100, prefetch=2))
+
+        self.assertEqual([100, 100, 50], [len(page) for page in pages])
+        self.assertTrue(all(isinstance(page, ScreenerDataFrame) for page in pages))
+        df = pd.concat(pages)
+        self.assertEqual([f"america:S{i}" for i in range(250)], list(df["Symbol"]))
+        self.assertEqual(list(range(250)), list(df.index))
+
+    def test_iter_pages_stop_early(self):
+        with ScanServer(total_count=1000, delay=0.05) as server:
+            ss = StockScreener()
+            ss.url = server.url
+            pages = ss.iter_pages(page_size=100, prefetch=2)
+            next(pages)
+            pages.close()
+            # The first page and at most the prefetched windows were requested
+            self.assertLessEqual(server.request_count, 3)
+
+    def test_iter_pages_records(self):
+        with ScanServer(total_count=5) as server:
+            ss = StockScreener()
+            ss.url = server.url
+            pages = list(ss.iter_pages(page_size=2, backend="records"))
+        self.assertEqual([2, 2, 1], [len(page) for page in pages])
+        self.assertEqual("america:S4", pages[-1][0]["Symbol"])
+
+    def test_iter_pages_invalid_prefetch(self):
+        with self.assertRaises(ValueError):
+            StockScreener().iter_pages(prefetch=0)
+
+    def test_invalid_page_size(self):
+        with ScanServer(total_count=250) as server:
+            ss = StockScreener()
+            ss.url = server.url
+            for page_size in (0, -100):
+                with self.assertRaises(ValueError):
+                    ss.get_all(page_size=page_size)
+                with self.assertRaises(ValueError):
+                    ss.iter_pages(page_size=page_size)
+                with self.assertRaises(ValueError):
+                    ss.aiter_pages(page_size=page_size)
+            self.assertEqual(0, server.request_count)
+
+    @unittest.skipIf(importlib.util.find_spec("aiohttp") is None, "aiohttp is not installed")
+    def test_aiter_pages(self):
+        async def collect(url):
+            ss = StockScreener()
+            ss.url = url
+            return [page async for page in ss.aiter_pages(page_size=100, prefetch=2)]
+
+        with ScanServer(total_count=250) as server:
+            pages = asyncio.run(collect(server.url))
+        self.assertEqual([100, 100, 50], [len(page) for page in pages])
+        self.assertEqual([f"america:S{i}" for i in range(250)], list(pd.concat(pages)["Symbol"]))
+
+    @unittest.skipIf(importlib.util.find_spec("aiohttp") is None, "aiohttp is not installed")
+    def test_aiter_pages_malformed_request(self):
+        async def collect(url):
+            ss = StockScreener()
+            ss.url = url
+            return [page async for page in ss.aiter_pages()]
+
+        with ScanServer(status=400) as server:
+            with self.assertRaises(MalformedRequestException):
+                asyncio.run(collect(server.url))
@@ -0,0 +1,122 @@
+import asyncio
+import contextlib
+import io
+import json
+import unittest
+
+from tvscreener import StockScreener, StockField, TimeInterval, FilterOperator, AsyncScreenerSession, Filter, Market
+from tests.unit.scan_server import ScanServer
+
+
+class TestPayload(unittest.TestCase):
+
+    def test_compact(self):
+        with ScanServer(total_count=5) as server:
+            ss = StockScreener()
+            ss.url = server.url
+            ss.get()
+        body = server.bodies[0]
+        self.assertNotIn(b"\n", body)
+        self.assertNotIn(b", ", body)
+        self.assertEqual(server.payloads[0], json.loads(body))
+
+    def test_print_request(self):
+        with ScanServer(total_count=5) as server:
+            ss = StockScreener()
+            ss.url = server.url
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                ss.get(print_request=True)
+        printed = output.getvalue().split("Payload:\n", 1)[1]
+        self.assertIn('\n    "columns": [', printed)
+        self.assertEqual(server.payloads[0], json.loads(printed))
+
+    def test_gzip(self):
+        with ScanServer(total_count=5) as server:
+            ss = StockScreener()
+            ss.url = server.url
+            expected = ss.get()
+            ss.set_request_compression("gzip")
+            df = ss.get()
+        self.assertTrue(server.bodies[1].startswith(b"\x1f\x8b"))
+        self.assertLess(len(server.bodies[1]), len(server.bodies[0]))
+        self.assertEqual(server.payloads[0], server.payloads[1])
+        self.assertTrue(expected.equals(df))
+
+    def test_gzip_async(self):
+        async def _aget(ss):
+            async with AsyncScreenerSession() as session:
+                return await ss.aget(session=session)
+
+        with ScanServer(total_count=5) as server:
+            ss = StockScreener()
+            ss.url = server.url
+            ss.set_request_compression("gzip")
+            df = asyncio.run(_aget(ss))
+        self.assertTrue(server.bodies[0].startswith(b"\x1f\x8b"))
+        self.assertEqual(5, len(df))
+
+    def test_unknown_compression(self):
+        with self.assertRaises(ValueError):
+            StockScreener().set_request_compression("br")
+
+    def test_cached_payload(self):
+        ss = StockScreener()
+        columns, payload_json = ss._prepare_request(TimeInterval.ONE_DAY)
+        self.assertIs(payload_json, ss._prepare_request(TimeInterval.ONE_DAY)[1])
+        self.assertIsNot(payload_json, ss._prepare_request(TimeInterval.FOUR_HOURS)[1])
+        self.assertIs(payload_json, ss._prepare_request(TimeInterval.ONE_DAY)[1])
+        # Overridden payloads are not cached
+        self.assertEqual([0, 10], json.loads(ss._prepare_request(TimeInterval.ONE_DAY, range=[0, 10])[1])["range"])
+        self.assertIs(payload_json, ss._prepare_request(TimeInterval.ONE_DAY)[1])
+
+    def test_cached_payload_invalidation(self):
+        changes = [
+            lambda ss: ss.set_range(0, 10),
+            lambda ss: ss.sort_by(StockField.PRICE),
+            lambda ss: ss.select(StockField.PRICE),
+            lambda ss: ss.add_filter(StockField.PRICE, FilterOperator.ABOVE, 10),
+            lambda ss: ss.add_option("lang", "fr"),
+            lambda ss: ss.add_misc("ignore_unknown_fields", True),
+            lambda ss: ss.set_markets(),
+        ]
+        for change in changes:
+            ss = StockScreener()
+            ss.add_filter(StockField.VOLUME, FilterOperator.ABOVE, 1)
+            payload_json = ss._prepare_request(TimeInterval.ONE_DAY)[1]
+            change(ss)
+            new_payload_json = ss._prepare_request(TimeInterval.ONE_DAY)[1]
+            self.assertNotEqual(payload_json, new_payload_json)
+            self.assertEqual(json.loads(new_payload_json), ss._build_payload(json.loads(new_payload_json)["columns"]))
+
+    def test_cached_payload_in_place_changes(self):
+        changes = [
+            lambda ss: ss.markets.append(Market.FRANCE),
+            lambda ss: ss.options.__setitem__("lang", "fr"),
+            lambda ss: ss.filters.append(Filter(StockField.PRICE, FilterOperator.ABOVE, 10)),
+            lambda ss: ss.filters[0].values.append(2),
+            lambda ss: ss.range.__setitem__(1, 10),
+            lambda ss: ss.misc.__setitem__("ignore_unknown_fields", True),
+        ]
+        with ScanServer(total_count=5) as server:
+            for change in changes:
+                ss = StockScreener()
+                ss.url = server.url
+                ss.add_filter(StockField.VOLUME, FilterOperator.ABOVE, 1)
+                ss.get()
+                change(ss)
+                ss.get()
+                self.assertEqual(ss._build_payload(server.payloads[-1]["columns"]), server.payloads[-1])
+                self.assertNotEqual(server.payloads[-2], server.payloads[-1])
+
+    def test_cached_payload_remove_filter(self):
+        ss = StockScreener()
+        ss.add_filter(StockField.PRICE, FilterOperator.ABOVE, 10)
+        payload_json = ss._prepare_request(TimeInterval.ONE_DAY)[1]
+        ss.remove_filter(StockField.PRICE)
+        self.assertEqual([], json.loads(ss._prepare_request(TimeInterval.ONE_DAY)[1])["filter"])
+        self.assertNotEqual(payload_json, ss._prepare_request(TimeInterval.ONE_DAY)[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+
+from tvscreener import StockScreener, CryptoScreener, StockField, CryptoField, TimeInterval, FilterOperator, \
+    ExtraFilter, get_columns_to_request
+from tests.unit.scan_server import ScanServer
+
+
+class TestSelect(unittest.TestCase):
+
+    def test_columns_selected(self):
+        columns = get_columns_to_request(StockField, TimeInterval.ONE_DAY, {StockField.PRICE, StockField.VOLUME})
+        self.assertEqual({"close": "Price", "volume": "Volume"}, columns)
+
+    def test_columns_selected_companions(self):
+        columns = get_columns_to_request(StockField, TimeInterval.SIXTY_MINUTES,
+                                         {StockField.BULL_BEAR_POWER, StockField.MOMENTUM_10})
+        self.assertEqual({"BBPower|60", "Mom|60", "update_mode|60", "Rec.BBPower", "Mom[1]|60"}, set(columns))
+
+    def test_select_required_fields(self):
+        ss = StockScreener()
+        ss.select(StockField.PRICE)
+        ss.add_filter(StockField.COUNTRY, FilterOperator.EQUAL, "France")
+        ss.add_filter(ExtraFilter.PRIMARY, FilterOperator.EQUAL, True)
+        self.assertEqual({StockField.PRICE, StockField.NAME, StockField.DESCRIPTION,
+                          StockField.MARKET_CAPITALIZATION, StockField.COUNTRY}, ss._get_selected_fields())
+
+    def test_select_reset(self):
+        ss = StockScreener()
+        ss.select(StockField.PRICE)
+        ss.select()
+        self.assertIsNone(ss._get_selected_fields())
+
+    def test_select_unknown_field(self):
+        cs = CryptoScreener()
+        with self.assertRaises(ValueError):
+            cs.select(StockField.PRICE)
+
+    def test_select_get(self):
+        with ScanServer(total_count=5) as server:
+            cs = CryptoScreener()
+            cs.url = server.url
+            cs.select(CryptoField.PRICE, CryptoField.CHANGE_PERCENT)
+            df = cs.get()
+            requested = server.payloads[0]["columns"]
+
+        self.assertEqual({"name", "description", "close", "change", "24h_vol|5"}, set(requested))
+        self.assertEqual(["Symbol", "Name", "Description"], list(df.columns[:3]))
+        self.assertEqual(6, len(df.columns))
@@ -0,0 +1,70 @@
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from tvscreener import StockScreener, CryptoScreener, ForexScreener, ScreenerSession, get_default_session, \
+    set_default_session
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+
+    def do_HEAD(self):
+        _Handler.connections.add(self.client_address)
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class TestSession(unittest.TestCase):
+
+    def test_default_session_shared(self):
+        ss = StockScreener()
+        cs = CryptoScreener()
+        fs = ForexScreener()
+        self.assertIs(ss.session, get_default_session())
+        self.assertIs(ss.session, cs.session)
+        self.assertIs(ss.session, fs.session)
+
+    def test_injected_session(self):
+        session = ScreenerSession(pool_maxsize=2)
+        ss = StockScreener(session=session)
+        self.assertIs(session, ss.session)
+        self.assertIsNot(session, StockScreener().session)
+
+    def test_set_default_session(self):
+        previous = get_default_session()
+        session = ScreenerSession()
+        try:
+            set_default_session(session)
+            self.assertIs(session, StockScreener().session)
+        finally:
+            set_default_session(previous)
+
+    def test_pool_configuration(self):
+        session = ScreenerSession(pool_connections=2, pool_maxsize=8)
+        adapter = session.session.get_adapter("https://scanner.tradingview.com/global/scan")
+        self.assertEqual(2, adapter._pool_connections)
+        self.assertEqual(8, adapter._pool_maxsize)
+
+    def test_warmup(self):
+        _Handler.connections = set()
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            url = f"http://127.0.0.1:{server.server_port}/global/scan"
+            with ScreenerSession(pool_maxsize=4) as session:
+                self.assertEqual(3, session.warmup(url, 3))
+            self.assertGreaterEqual(len(_Handler.connections), 1)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_warmup_unreachable(self):
+        with ScreenerSession() as session:
+            self.assertEqual(0, session.warmup("http://127.0.0.1:9/scan", 2))
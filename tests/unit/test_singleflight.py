@@ -0,0 +1,187 @@
+import asyncio
+import copy
+import importlib.util
+import pickle
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from tvscreener import StockScreener, SingleFlight, get_default_single_flight
+from tests.unit.scan_server import ScanServer
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def test_do(self):
+        group = SingleFlight()
+        self.assertEqual(3, group.do("key", lambda x: x + 1, 2))
+        self.assertEqual({"calls": 1, "executions": 1, "shared": 0}, group.stats())
+
+    def test_do_concurrent(self):
+        group = SingleFlight()
+        started = threading.Event()
+        executions = []
+
+        def _slow():
+            executions.append(1)
+            started.set()
+            time.sleep(0.2)
+            return "result"
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            leader = executor.submit(group.do, "key", _slow)
+            started.wait()
+            followers = [executor.submit(group.do, "key", _slow) for _ in range(7)]
+            results = [leader.result()] + [follower.result() for follower in followers]
+
+        self.assertEqual(["result"] * 8, results)
+        self.assertEqual(1, len(executions))
+        self.assertEqual({"calls": 8, "executions": 1, "shared": 7}, group.stats())
+
+    def test_do_error(self):
+        group = SingleFlight()
+        started = threading.Event()
+
+        def _fail():
+            started.set()
+            time.sleep(0.1)
+            raise ValueError("failure")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(group.do, "key", _fail)
+            started.wait()
+            follower = executor.submit(group.do, "key", _fail)
+            with self.assertRaises(ValueError):
+                leader.result()
+            with self.assertRaises(ValueError):
+                follower.result()
+        # The failed call is not kept
+        self.assertEqual(1, group.do("key", lambda: 1))
+
+    def test_ado(self):
+        group = SingleFlight()
+        executions = []
+
+        async def _slow(value):
+            executions.append(value)
+            await asyncio.sleep(0.05)
+            return value
+
+        async def _run():
+            return await asyncio.gather(*(group.ado("key", _slow, 1) for _ in range(5)), group.ado("other", _slow, 2))
+
+        self.assertEqual([1, 1, 1, 1, 1, 2], asyncio.run(_run()))
+        self.assertEqual([1, 2], executions)
+        self.assertEqual({"calls": 6, "executions": 2, "shared": 4}, group.stats())
+
+    def test_ado_error(self):
+        group = SingleFlight()
+
+        async def _fail():
+            await asyncio.sleep(0.05)
+            raise ValueError("failure")
+
+        async def _run():
+            return await asyncio.gather(group.ado("key", _fail), group.ado("key", _fail), return_exceptions=True)
+
+        results = asyncio.run(_run())
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+
+    def test_ado_leader_cancelled(self):
+        group = SingleFlight()
+        executions = []
+
+        async def _slow():
+            executions.append(1)
+            await asyncio.sleep(0.2)
+            return "result"
+
+        async def _run():
+            leader = asyncio.ensure_future(asyncio.wait_for(group.ado("key", _slow), 0.05))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(group.ado("key", _slow))
+            with self.assertRaises(asyncio.TimeoutError):
+                await leader
+            return await follower
+
+        self.assertEqual("result", asyncio.run(_run()))
+        self.assertEqual([1], executions)
+
+    def test_ado_all_cancelled(self):
+        group = SingleFlight()
+        cancelled = []
+
+        async def _slow():
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(1)
+                raise
+            return "result"
+
+        async def _fast():
+            return "new"
+
+        async def _run():
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(group.ado("key", _slow), 0.05)
+            await asyncio.sleep(0)
+            # The abandoned call is cancelled, and forgotten
+            return await group.ado("key", _fast)
+
+        self.assertEqual("new", asyncio.run(_run()))
+        self.assertEqual([1], cancelled)
+
+    def test_default_single_flight(self):
+        self.assertIs(get_default_single_flight(), StockScreener().single_flight)
+
+    def test_pickle(self):
+        ss = StockScreener()
+        for copied in (pickle.loads(pickle.dumps(ss)), copy.deepcopy(ss)):
+            self.assertIs(get_default_single_flight(), copied.single_flight)
+        group = SingleFlight()
+        group.do("key", lambda: 1)
+        ss.set_single_flight(group)
+        copied = pickle.loads(pickle.dumps(ss)).single_flight
+        self.assertIsInstance(copied, SingleFlight)
+        self.assertEqual(1, copied.do("key", lambda: 1))
+
+    def test_screener_coalescing(self):
+        with ScanServer(total_count=10, delay=0.3) as server:
+            group = SingleFlight()
+            screeners = [StockScreener() for _ in range(6)]
+            for screener in screeners:
+                screener.url = server.url
+                screener.set_single_flight(group)
+            with ThreadPoolExecutor(max_workers=6) as executor:
+                dfs = list(executor.map(lambda screener: screener.get(), screeners))
+            self.assertEqual(1, server.request_count)
+
+        self.assertTrue(all(df.equals(dfs[0]) for df in dfs))
+        self.assertEqual(5, group.shared)
+
+    def test_screener_no_coalescing(self):
+        with ScanServer(total_count=10, delay=0.2) as server:
+            screeners = [StockScreener() for _ in range(3)]
+            for screener in screeners:
+                screener.url = server.url
+                screener.set_single_flight(None)
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                list(executor.map(lambda screener: screener.get(), screeners))
+            self.assertEqual(3, server.request_count)
+
+    @unittest.skipIf(importlib.util.find_spec("aiohttp") is None, "aiohttp is not installed")
+    def test_screener_async_coalescing(self):
+        async def _run(screeners):
+            return await asyncio.gather(*(screener.aget() for screener in screeners))
+
+        with ScanServer(total_count=10, delay=0.2) as server:
+            group = SingleFlight()
+            screeners = [StockScreener() for _ in range(4)]
+            for screener in screeners:
+                screener.url = server.url
+                screener.set_single_flight(group)
+            asyncio.run(_run(screeners))
+            self.assertEqual(1, server.request_count)
+        self.assertEqual(3, group.shared)
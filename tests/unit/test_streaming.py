@@ -0,0 +1,133 @@
+import importlib.util
+import json
+import unittest
+
+import numpy as np
+
+from tvscreener import StockScreener, StockField
+from tvscreener.json_backends import dumps, loads, resolve_json_backend
+from tvscreener.streaming import StreamDecoder
+from tvscreener.util import decode_columns
+from tests.unit.scan_server import ScanServer
+
+
+def _make_response(rows):
+    data = [{"s": f"america:S{i}", "d": [f"S{i}", float(i) if i % 3 else None, i % 2 == 0, f'x"{i}\u00e9']}
+            for i in range(rows)]
+    return {"totalCount": rows, "data": data}
+
+
+def _feed(body, chunk_size, batch_size=2):
+    decoder = StreamDecoder(4, batch_size=batch_size)
+    for i in range(0, len(body), chunk_size):
+        decoder.feed(body[i:i + chunk_size])
+    return decoder.close()
+
+
+class TestStreamDecoder(unittest.TestCase):
+
+    def _assert_columns_equal(self, expected, actual):
+        self.assertEqual(len(expected), len(actual))
+        for expected_column, column in zip(expected, actual):
+            if hasattr(expected_column, "dtype"):
+                np.testing.assert_array_equal(expected_column, column)
+            else:
+                self.assertEqual(list(expected_column), list(column))
+
+    def test_chunk_sizes(self):
+        response = _make_response(7)
+        body = json.dumps(response, indent=2).encode()
+        expected = decode_columns(response["data"], 4)
+        for chunk_size in (1, 3, 7, len(body)):
+            result = _feed(body, chunk_size)
+            self.assertEqual(7, result["totalCount"])
+            self.assertNotIn("data", result)
+            self._assert_columns_equal(expected, result["columns"])
+
+    def test_members_after_data(self):
+        body = b'{"data": [{"s": "a", "d": [1.5, 2, "x", null]}], "totalCount": 1}'
+        result = _feed(body, 5)
+        self.assertEqual(1, result["totalCount"])
+        self.assertEqual(["a"], list(result["columns"][0]))
+        self.assertEqual([1.5], result["columns"][1].tolist())
+
+    def test_missing_batch(self):
+        # The first batch has only missing values, the float column is still an array
+        body = json.dumps({"data": [{"s": "a", "d": [None]}, {"s": "b", "d": [2.5]}]}).encode()
+        decoder = StreamDecoder(1, batch_size=1)
+        decoder.feed(body)
+        column = decoder.close()["columns"][1]
+        self.assertTrue(np.isnan(column[0]))
+        self.assertEqual(2.5, column[1])
+
+    def test_empty(self):
+        result = _feed(b'{"totalCount": 0, "data": []}', 4)
+        self.assertEqual(0, result["totalCount"])
+        self.assertEqual(5, len(result["columns"]))
+
+    def test_incomplete(self):
+        with self.assertRaises(ValueError):
+            _feed(b'{"totalCount": 1, "data": [{"s": "a", "d": [1, 2, 3', 4)
+        with self.assertRaises(ValueError):
+            _feed(b'{"totalCount": 1] ', 4)
+
+
+class TestJsonBackends(unittest.TestCase):
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            resolve_json_backend("simplejson")
+        with self.assertRaises(ValueError):
+            StockScreener().set_json_backend("simplejson")
+
+    def test_json(self):
+        payload = {"columns": ["name", "close"], "range": [0, 150]}
+        self.assertEqual(payload, loads(dumps(payload)))
+        self.assertEqual(json.dumps(payload, indent=4), dumps(payload, indent=4))
+
+    @unittest.skipIf(importlib.util.find_spec("orjson") is None, "orjson is not installed")
+    def test_orjson(self):
+        payload = {"columns": ["name", "close"], "range": [0, 150]}
+        self.assertEqual(payload, loads(dumps(payload, "orjson"), "orjson"))
+        self.assertEqual("orjson", resolve_json_backend("auto"))
+
+    @unittest.skipIf(importlib.util.find_spec("msgspec") is None, "msgspec is not installed")
+    def test_msgspec(self):
+        payload = {"columns": ["name", "close"], "range": [0, 150]}
+        self.assertEqual(payload, loads(dumps(payload, "msgspec"), "msgspec"))
+
+
+class TestScreenerStreaming(unittest.TestCase):
+
+    def _get(self, configure, **kwargs):
+        with ScanServer(total_count=20) as server:
+            ss = StockScreener()
+            ss.url = server.url
+            ss.select(StockField.PRICE, StockField.SECTOR)
+            expected = ss.get(**kwargs)
+            configure(ss)
+            df = ss.get(**kwargs)
+        return expected, df
+
+    def test_streaming(self):
+        expected, df = self._get(lambda ss: ss.set_streaming(True))
+        self.assertTrue(expected.equals(df))
+        self.assertEqual(expected.attrs, df.attrs)
+
+    def test_streaming_records(self):
+        expected, records = self._get(lambda ss: ss.set_streaming(True), backend="records")
+        self.assertEqual(expected, records)
+
+    @unittest.skipIf(importlib.util.find_spec("pyarrow") is None, "pyarrow is not installed")
+    def test_streaming_arrow(self):
+        expected, table = self._get(lambda ss: ss.set_streaming(True), backend="arrow")
+        self.assertTrue(expected.equals(table))
+
+    @unittest.skipIf(importlib.util.find_spec("orjson") is None, "orjson is not installed")
+    def test_orjson_backend(self):
+        expected, df = self._get(lambda ss: ss.set_json_backend("orjson"))
+        self.assertTrue(expected.equals(df))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+
+import pandas as pd
+
+from tvscreener import StockScreener, StockField, TimeInterval, ScreenerDataFrame
+from tvscreener.util import get_columns_to_request_by_interval
+from tests.unit.scan_server import ScanServer
+
+INTERVALS = [TimeInterval.FIVE_MINUTES, TimeInterval.SIXTY_MINUTES, TimeInterval.ONE_DAY]
+
+
+class TestTimeIntervals(unittest.TestCase):
+
+    def test_columns_by_interval(self):
+        columns = get_columns_to_request_by_interval(StockField, INTERVALS)
+        self.assertEqual(("Relative Strength Index (14)", "5"), columns["RSI|5"])
+        self.assertEqual(("Relative Strength Index (14)", "60"), columns["RSI|60"])
+        self.assertEqual(("Relative Strength Index (14)", "1D"), columns["RSI"])
+        self.assertEqual(("Update Mode", "60"), columns["update_mode|60"])
+        self.assertEqual(("Name", ""), columns["name"])
+        self.assertNotIn("update_mode|1D", columns)
+
+    def test_columns_by_interval_requested_once(self):
+        columns = get_columns_to_request_by_interval(StockField, INTERVALS, {StockField.SECTOR, StockField.VOLUME})
+        self.assertEqual({"sector": ("Sector", ""),
+                          "volume|5": ("Volume", "5"), "update_mode|5": ("Update Mode", "5"),
+                          "volume|60": ("Volume", "60"), "update_mode|60": ("Update Mode", "60"),
+                          "volume": ("Volume", "1D")}, columns)
+
+    def test_columns_single_interval(self):
+        columns = get_columns_to_request_by_interval(StockField, [TimeInterval.ONE_DAY], {StockField.VOLUME,
+                                                                                          StockField.SECTOR})
+        self.assertEqual({"sector": ("Sector", ""), "volume": ("Volume", "1D")}, columns)
+
+    def test_get_multiple_intervals(self):
+        with ScanServer(total_count=3) as server:
+            ss = StockScreener()
+            ss.url = server.url
+            ss.select(StockField.RELATIVE_STRENGTH_INDEX_14)
+            df = ss.get(time_interval=INTERVALS)
+            self.assertEqual(1, server.request_count)
+
+        self.assertIsInstance(df, ScreenerDataFrame)
+        self.assertIsInstance(df.columns, pd.MultiIndex)
+        self.assertEqual("interval", df.columns.names[1])
+        self.assertEqual([("Symbol", ""), ("Name", ""), ("Description", "")], list(df.columns[:3]))
+        self.assertEqual(["5", "60", "1D"], list(df["Relative Strength Index (14)"].columns))
+        self.assertEqual("S1", df.loc[1, ("Name", "")])
+        self.assertEqual("america:S1", df.loc[1, ("Symbol", "")])
+
+    def test_technical_columns_multiple_intervals(self):
+        with ScanServer(total_count=3) as server:
+            ss = StockScreener()
+            ss.url = server.url
+            ss.select(StockField.VOLUME)
+            df = ss.get(time_interval=INTERVALS)
+        df.set_technical_columns(only=True)
+        self.assertIn("volume|60", df.columns)
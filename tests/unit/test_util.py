@@ -1,6 +1,11 @@
+import pickle
 import unittest
 
-from tvscreener import StockField, TimeInterval, get_columns_to_request, get_recommendation, millify
+import pandas as pd
+
+from tvscreener import ScreenerDataFrame, StockField, TimeInterval, get_columns_to_request, get_recommendation, millify
+from tvscreener.core.base import Screener
+from tvscreener.util import decode_columns, get_columns_to_request_by_interval
 
 
 class TestUtil(unittest.TestCase):
@@ -14,6 +19,27 @@ class TestUtil(unittest.TestCase):
         columns = get_columns_to_request(StockField, TimeInterval.ONE_DAY)
         self.assertIsInstance(columns, dict)
 
+    def test_get_columns_memoized(self):
+        columns = get_columns_to_request(StockField, TimeInterval.ONE_DAY, [StockField.PRICE, StockField.VOLUME])
+        self.assertIs(columns,
+                      get_columns_to_request(StockField, TimeInterval.ONE_DAY, {StockField.VOLUME, StockField.PRICE}))
+        self.assertIsNot(columns, get_columns_to_request(StockField, TimeInterval.ONE_WEEK,
+                                                         [StockField.PRICE, StockField.VOLUME]))
+        intervals = [TimeInterval.ONE_DAY, TimeInterval.SIXTY_MINUTES]
+        self.assertIs(get_columns_to_request_by_interval(StockField, intervals),
+                      get_columns_to_request_by_interval(StockField, intervals))
+
+    def test_get_columns_immutable(self):
+        columns = get_columns_to_request(StockField, TimeInterval.ONE_DAY)
+        with self.assertRaises(TypeError):
+            columns["close"] = "Close"
+        with self.assertRaises(TypeError):
+            columns.pop("close")
+        with self.assertRaises(TypeError):
+            columns |= {"close": "Close"}
+        self.assertEqual(columns, pickle.loads(pickle.dumps(columns)))
+        self.assertEqual({**columns, "market": "Market"}["market"], "Market")
+
     def test_get_recommendation(self):
         self.assertEqual("S", get_recommendation(-1))
         self.assertEqual("N", get_recommendation(0))
@@ -23,3 +49,24 @@ class TestUtil(unittest.TestCase):
         self.assertEqual("1.000M", millify(10 ** 6))
         self.assertEqual("10.000M", millify(10 ** 7))
         self.assertEqual("1.000B", millify(10 ** 9))
+
+    def _assert_decoded_like_rows(self, rows):
+        width = len(rows[0]) if rows else 3
+        columns = {"name": "Name", "description": "Description", **{f"c{i}": f"C{i}" for i in range(2, width)}}
+        response = {"data": [{"s": f"EX:S{i}", "d": row} for i, row in enumerate(rows)]}
+        expected = ScreenerDataFrame([[d["s"]] + d["d"] for d in response["data"]], columns)
+        df = Screener._to_dataframe(response, columns)
+        pd.testing.assert_frame_equal(expected, df)
+
+    def test_decode_columns_types(self):
+        self._assert_decoded_like_rows([["a", "A", 1.5, 1, True, None, None, 2, "x"],
+                                        ["b", "B", None, 2, False, 2.5, None, 3.5, None],
+                                        ["c", "C", 3.0, 3, True, None, None, None, "z"]])
+
+    def test_decode_columns_array_values(self):
+        self._assert_decoded_like_rows([["a", "A", 1.5, [1, 2]], ["b", "B", 2.5, [3, 4]]])
+        self._assert_decoded_like_rows([["a", "A", 1.5, [1, 2]], ["b", "B", 2.5, [3]]])
+
+    def test_decode_columns_empty(self):
+        self.assertEqual([0, 0, 0], [len(column) for column in decode_columns([], 2)])
+        self._assert_decoded_like_rows([])
@@ -1,20 +1,56 @@
-from .core.base import Screener, ScreenerDataFrame
-from .core.crypto import CryptoScreener
-from .core.forex import ForexScreener
-from .core.stock import StockScreener
-from .exceptions import MalformedRequestException
-from .field import *
-from .field.stock import StockField
-from .field.forex import ForexField
-from .field.crypto import CryptoField
-from .filter import Filter, FilterOperator, ExtraFilter
-from .util import *
+import importlib.util
+
+# The submodules are imported on first access to one of their names, so that importing the package stays cheap and
+# only the screeners that are used import requests, pandas and their fields
+_LAZY_ATTRIBUTES = {
+    "ResponseCache": ".cache", "DiskCache": ".cache", "BarExpiry": ".cache",
+    "Screener": ".core.base", "gather_screens": ".core.base",
+    "ScreenerDataFrame": ".core.dataframe",
+    "CryptoScreener": ".core.crypto",
+    "ForexScreener": ".core.forex",
+    "StockScreener": ".core.stock",
+    "MalformedRequestException": ".exceptions",
+    "StockField": ".field.stock",
+    "ForexField": ".field.forex",
+    "CryptoField": ".field.crypto",
+    "Filter": ".filter", "FilterOperator": ".filter", "ExtraFilter": ".filter",
+    "ScreenerSession": ".session", "AsyncScreenerSession": ".session",
+    "get_default_session": ".session", "set_default_session": ".session",
+    "SingleFlight": ".singleflight", "get_default_single_flight": ".singleflight",
+}
+# Modules whose public names are all exported
+_STAR_MODULES = (".field", ".util")
 
 __all__ = [
-    "Screener", "ScreenerDataFrame",
+    "Screener", "ScreenerDataFrame", "gather_screens",
     "StockScreener", "ForexScreener", "CryptoScreener",
-    "MalformedRequestException",
+    "MalformedRequestException", "ResponseCache", "DiskCache", "BarExpiry",
+    "ScreenerSession", "AsyncScreenerSession", "get_default_session", "set_default_session",
+    "SingleFlight", "get_default_single_flight",
     "Field", "Filter", "FilterOperator", "ExtraFilter",
     "StockField", "ForexField", "CryptoField",
     "Market", "Exchange", "Country", "Sector", "Industry", "TimeInterval",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    elif importlib.util.find_spec(f"{__name__}.{name}") is not None:
+        # Submodule, e.g. tvscreener.backends
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        for module_name in _STAR_MODULES:
+            module = importlib.import_module(module_name, __name__)
+            if not name.startswith("_") and hasattr(module, name):
+                value = getattr(module, name)
+                break
+        else:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cached, so that the next accesses do not go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(__all__))
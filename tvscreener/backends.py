@@ -0,0 +1,95 @@
+import json
+
+from tvscreener.util import get_response_columns, order_columns
+
+# Configuration constants
+BACKENDS = ("pandas", "arrow", "polars", "records")
+METADATA_KEY = "original_columns"
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("The arrow backend requires pyarrow: pip install tvscreener[arrow]") from e
+    return pyarrow
+
+
+def _import_polars():
+    try:
+        import polars
+    except ImportError as e:
+        raise ImportError("The polars backend requires polars: pip install tvscreener[polars]") from e
+    return polars
+
+
+def flatten_label(label) -> str:
+    """
+    Flatten a (label, time interval) column of a multi time interval result into "label|time interval", the label
+    alone being kept for the columns that do not depend on the time interval.
+    """
+    if isinstance(label, tuple):
+        label, interval = label
+        return f"{label}|{interval}" if interval else label
+    return label
+
+
+def _decode(response_json, columns):
+    ordered_columns = order_columns(columns)
+    decoded = dict(zip(["symbol", *columns], get_response_columns(response_json, len(columns))))
+    return ordered_columns, [(flatten_label(label), decoded[k]) for k, label in ordered_columns.items()]
+
+
+def to_arrow(response_json, columns):
+    """
+    Decode a /scan response into a pyarrow Table, without going through pandas.
+
+    The technical columns are stored as JSON in the "original_columns" entry of the schema metadata.
+
+    :param response_json: Decoded JSON response
+    :param columns: dict of technical column and label, in the order of the request
+    :return: pyarrow.Table with the same column labels as the ScreenerDataFrame
+    """
+    pa = _import_pyarrow()
+    ordered_columns, decoded = _decode(response_json, columns)
+    # from_pandas: NaN are missing values, as in the ScreenerDataFrame
+    arrays = [pa.array(values, from_pandas=True) for _, values in decoded]
+    metadata = {METADATA_KEY: json.dumps(ordered_columns)}
+    return pa.Table.from_arrays(arrays, names=[label for label, _ in decoded], metadata=metadata)
+
+
+def to_polars(response_json, columns):
+    """
+    Decode a /scan response into a polars DataFrame, without going through pandas.
+
+    polars frames do not carry metadata: the technical columns are given by order_columns(columns).
+
+    :param response_json: Decoded JSON response
+    :param columns: dict of technical column and label, in the order of the request
+    :return: polars.DataFrame with the same column labels as the ScreenerDataFrame
+    """
+    pl = _import_polars()
+    _, decoded = _decode(response_json, columns)
+    return pl.DataFrame([pl.Series(label, values, strict=False, nan_to_null=True) for label, values in decoded])
+
+
+def to_records(response_json, columns):
+    """
+    Decode a /scan response into plain records, without importing pandas nor numpy.
+
+    :param response_json: Decoded JSON response
+    :param columns: dict of technical column and label, in the order of the request
+    :return: list of dicts of column label and raw value, with the same labels as the ScreenerDataFrame
+    """
+    positions = {k: i for i, k in enumerate(["symbol", *columns])}
+    labels = [(flatten_label(label), positions[k]) for k, label in order_columns(columns).items()]
+    records = []
+    for row in response_json['data']:
+        values = [row["s"], *row["d"]]
+        records.append({label: values[i] for label, i in labels})
+    return records
+
+
+def get_original_columns(table) -> dict:
+    """Return the technical columns stored in the metadata of a pyarrow Table returned by the arrow backend."""
+    return json.loads(table.schema.metadata[METADATA_KEY.encode()])
@@ -1,75 +1,323 @@
+import shutil
+import warnings
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
 from tvscreener import Field, millify, get_recommendation
-from tvscreener.field import Rating
+from tvscreener.field import Rating, add_rec_to_label, add_historical_to_label
+from tvscreener.util import millnames
+
+# Configuration constants
+PLAN_CACHE_SIZE = 64  # formatting plans kept, one per type of fields and columns
+DISPLAY_ROWS = 50  # rows rendered by a BeautifyView
+# Beautify methods applied to the columns of each format, in order
+FORMATTERS = {
+    'bool': ('_to_bool',),
+    'rating': ('_rating',),
+    'round': ('_round',),
+    'percent': ('_percent',),
+    'recommendation': ('_recommendation',),
+    'number_group': ('_replace_nan', '_number_group'),
+    'computed_recommendation': ('_computed_recommendation',),
+    'text': ('_text',),
+    'date': ('_date',),
+    'missing': ('_missing',),
+    'currency': ('_currency',),
+    'float': ('_float',),
+}
+# Formats whose formatters read other columns: planned first, while these columns are still numbers
+RAW_READERS = ('computed_recommendation',)
+CURRENCY_FIELD_NAME = 'currency'
+PRICE_FIELD_NAME = 'close'
+PREVIOUS = 'previous'  # the indicator is compared to its previous value, the "Prev." column of the results
+BELOW = 'below'  # buy when the indicator is below the buy bound, sell when it is above the sell bound
+ABOVE = 'above'  # buy when the indicator is above the buy bound, sell when it is below the sell bound
+# (direction, buy bound, sell bound) of the indicators with a computed recommendation, by field name. A bound is a
+# number, PREVIOUS, or the field name of the column the indicator is compared to, row by row
+COMPUTED_RECOMMENDATIONS = {
+    **{f"{average}{length}": (BELOW, PRICE_FIELD_NAME, PRICE_FIELD_NAME)
+       for average in ("EMA", "SMA") for length in (5, 10, 20, 30, 50, 100, 200)},
+    'Ichimoku.BLine': (BELOW, PRICE_FIELD_NAME, PRICE_FIELD_NAME),
+    'P.SAR': (BELOW, PRICE_FIELD_NAME, PRICE_FIELD_NAME),
+    'RSI': (BELOW, 30, 70),
+    'RSI7': (BELOW, 30, 70),
+    'Stoch.K': (BELOW, 20, 80),
+    'Stoch.RSI.K': (BELOW, 20, 80),
+    'CCI20': (BELOW, -100, 100),
+    'W.R': (BELOW, -80, -20),
+    # Rising momentum is a buy, and positive momentum when the previous value is not in the results
+    'AO': (ABOVE, PREVIOUS, PREVIOUS),
+    'Mom': (ABOVE, PREVIOUS, PREVIOUS),
+    'MACD.macd': (ABOVE, 'MACD.signal', 'MACD.signal'),
+}
+CURRENCY_SYMBOLS = {'USD': '$', 'EUR': '€', 'GBP': '£', 'JPY': '¥', 'CNY': '¥', 'INR': '₹', 'KRW': '₩', 'BRL': 'R$'}
+CURRENCY_MILLIFY_FROM = 1e6  # amounts formatted as millify from this magnitude, with 2 decimals below
+FLOAT_SIGNIFICANT_DIGITS = 6
+MAX_SCALED = 2 ** 52  # scaled values above are not integers exact enough to be rounded
+TIE_TOLERANCE = 1e-15  # relative distance to a rounding tie under which a value is rounded by Python
+MILL_SCALES = np.array([float(10 ** (3 * i)) for i in range(len(millnames))])
+MILL_SUFFIXES = np.array(millnames)
 
 
-def beautify(df, specific_fields):
-    df = Beautify(df, specific_fields).df
+def beautify(df, specific_fields, inplace: bool = False):
+    df = Beautify(df, specific_fields, inplace).df
     return df
 
 
-class Beautify:
-    def __init__(self, df, specific_fields: Field):
-        self.df = df.copy()
-
-        for column in self.df.columns:
-            # Find the enum with the column name
-            specific_field = specific_fields.get_by_label(specific_fields, column)
-            if specific_field is not None and specific_field.format is not None:
-                # self._copy_column(column)
-                # fn = self.fn_mappings.get(format_)
-                self._format_column(specific_field, column)
-
-    def _format_column(self, specific_field, column):
-        # Fixed: Use == for value comparison instead of 'is'
-        if specific_field.format == 'bool':
-            self._to_bool(column)
-        elif specific_field.format == 'rating':
-            self._rating(column)
-        elif specific_field.format == 'round':
-            self._round(column)
-        elif specific_field.format == 'percent':
-            self._percent(column)
-        elif specific_field.has_recommendation():
-            self._recommendation(column, specific_field)
+def beautify_view(df, specific_fields, max_rows: int = DISPLAY_ROWS):
+    """
+    Return a view of the results formatted at render time: df is kept as numbers, for sorting and filtering, and only
+    the rows and columns displayed are formatted.
+
+    :param df: Screener results, with the labels of the fields as columns
+    :param specific_fields: Type of fields of the results (StockField, ForexField, CryptoField)
+    :param max_rows: Number of rows rendered
+    :return: BeautifyView of df
+    """
+    return BeautifyView(df, specific_fields, max_rows)
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def compile_plan(specific_fields, columns: tuple) -> tuple:
+    """
+    Compile the formatting plan of a schema, once: the formatters of the columns and their arguments.
+
+    :param specific_fields: Type of fields of the results (StockField, ForexField, CryptoField)
+    :param columns: Labels of the columns of the results
+    :return: tuple of (Beautify method, column, *arguments), in the order of the columns
+    """
+    plan = []
+    for column in columns:
+        # Find the enum with the column name
+        specific_field = specific_fields.from_label(column)
+        if specific_field is None or specific_field.format is None:
+            continue
+        if specific_field.format not in FORMATTERS:
+            # Reported once per schema, not on every call
+            warnings.warn(f"Unknown format: {specific_field.format} for column: {column}")
+            continue
+        args = ()
+        if specific_field.format == 'currency':
+            # Without the currency column, the amounts are formatted without symbol
+            args = (_get_label(specific_fields, CURRENCY_FIELD_NAME, columns),)
         elif specific_field.format == 'computed_recommendation':
-            # TODO: Implement computed recommendation formatting
-            pass
-        elif specific_field.format == 'text':
-            # TODO: Implement text formatting
-            pass
-        elif specific_field.format == 'date':
-            # TODO: Implement date formatting
-            pass
-        elif specific_field.format == 'missing':
-            # TODO: Implement missing value formatting
-            pass
-        elif specific_field.format == 'currency':
-            # TODO: Implement currency formatting
-            pass
-        elif specific_field.format == 'float':
-            # TODO: Implement float formatting
-            pass
-        elif specific_field.format == 'number_group':
-            self._replace_nan(column)
-            self._number_group(column)
-        else:
-            print(f"Unknown format: {specific_field.format} for column: {column}")
+            rule = COMPUTED_RECOMMENDATIONS.get(specific_field.field_name)
+            if rule is None:
+                # Indicators without direction (ADX) or bands are left as is
+                continue
+            direction, *bounds = rule
+            bounds = [_resolve_bound(specific_fields, specific_field, bound, columns) for bound in bounds]
+            if None in bounds:
+                if direction == BELOW:
+                    # Compared to the price, which is not in the results: left as is
+                    continue
+                bounds = [0 if bound is None else bound for bound in bounds]
+            args = (direction, *bounds)
+        elif specific_field.has_recommendation():
+            # The recommendation column is labeled after the field name in the results of the screeners
+            rec_column = next((label for label in (specific_field.get_rec_label(),
+                                                   add_rec_to_label(specific_field.field_name)) if label in columns),
+                              None)
+            if rec_column is None:
+                continue
+            args = (rec_column,)
+        plan.extend((specific_field.format in RAW_READERS, method, column, *args)
+                    for method in FORMATTERS[specific_field.format])
+    # Stable sort: the columns keep their order within the readers of raw columns and within the others
+    return tuple(step[1:] for step in sorted(plan, key=lambda step: not step[0]))
+
+
+def _resolve_bound(specific_fields, specific_field, bound, columns):
+    """Return the number, or the label of the column, of a bound of a computed recommendation, None if not in columns."""
+    if not isinstance(bound, str):
+        return bound
+    if bound == PREVIOUS:
+        label = add_historical_to_label(specific_field.label)
+        return label if label in columns else None
+    return _get_label(specific_fields, bound, columns)
+
+
+def _get_label(specific_fields, field_name, columns):
+    """Return the label of the field in the columns, None if the field is not in the results."""
+    specific_field = specific_fields.from_field_name(field_name)
+    return specific_field.label if specific_field is not None and specific_field.label in columns else None
+
+
+def _is_float(series):
+    return isinstance(series.dtype, np.dtype) and series.dtype.kind == "f"
+
+
+def _exact_rounding(scaled):
+    """
+    Return the mask of the scaled values whose nearest integer is the one of the exact, unscaled, value times the scale.
+
+    The scaling is off by half an ulp at most, which only matters for values close to a rounding tie, and for the
+    values too large or not finite.
+    """
+    magnitudes = np.abs(scaled)
+    with np.errstate(invalid="ignore"):
+        return (magnitudes < MAX_SCALED) & \
+            (np.abs(scaled - np.floor(scaled) - 0.5) > magnitudes * TIE_TOLERANCE)
+
+
+def _round(values, decimals):
+    """Vectorized round(x, decimals) of float64 values, identical to the Python round."""
+    scale = 10 ** decimals
+    with np.errstate(invalid="ignore", over="ignore"):
+        scaled = values * scale
+        rounded = np.rint(scaled) / scale
+    finite = np.isfinite(values)
+    rounded[~finite] = values[~finite]
+    inexact = finite & ~_exact_rounding(scaled)
+    rounded[inexact] = [round(value, decimals) for value in values[inexact].tolist()]
+    return rounded
+
+
+@lru_cache(maxsize=None)
+def _get_decimal_parts(decimals):
+    """Return the array of the decimal parts ".00", ".01", ..., indexed by their integer value."""
+    return np.array([f".{i:0{decimals}d}" for i in range(10 ** decimals)])
+
+
+def _format_fixed(values, decimals, suffixes="", negative=None):
+    """
+    Vectorized f"{x:.{decimals}f}{suffix}" of float64 values, identical to the Python formatting.
+
+    :param values: float64 array
+    :param decimals: Number of decimals
+    :param suffixes: Suffix, or array of suffixes, appended to the formatted values
+    :param negative: Mask of the values prefixed with "-" (default is the values with their sign bit set)
+    :return: Array of strings
+    """
+    scale = 10 ** decimals
+    magnitudes = np.abs(values)
+    negative = np.signbit(values) if negative is None else negative
+    with np.errstate(invalid="ignore", over="ignore"):
+        scaled = magnitudes * scale
+    exact = _exact_rounding(scaled)
+    integers = np.rint(np.where(exact, scaled, 0)).astype(np.int64)
+    text = np.char.add((integers // scale).astype(str), _get_decimal_parts(decimals)[integers % scale])
+    text = np.char.add(np.where(negative, "-", ""), np.char.add(text, suffixes))
+    nan = np.isnan(values)
+    text = np.where(nan, np.char.add("nan", suffixes), text)
+
+    inexact = ~exact & ~nan
+    if inexact.any():
+        # Formatted by Python, in an object array as the strings may be longer than the ones of the array
+        suffixes = np.broadcast_to(suffixes, values.shape)
+        text = text.astype(object)
+        text[inexact] = [f"{'-' if sign else ''}{magnitude:.{decimals}f}{suffix}" for sign, magnitude, suffix
+                         in zip(negative[inexact].tolist(), magnitudes[inexact].tolist(), suffixes[inexact].tolist())]
+    return text
+
+
+def _millify(values):
+    """Vectorized millify of float64 values, identical to util.millify."""
+    finite = np.isfinite(values)
+    # millify raises on the values that are not finite
+    for value in values[~finite].tolist():
+        millify(value)
+    magnitudes = np.abs(values)
+    with np.errstate(divide="ignore"):
+        indexes = np.floor(np.where(magnitudes == 0, 0, np.log10(magnitudes) / 3))
+    indexes = np.clip(indexes, 0, len(millnames) - 1).astype(np.int64)
+    return _format_fixed(magnitudes / MILL_SCALES[indexes], 3, MILL_SUFFIXES[indexes], negative=values < 0)
+
+
+def _recommendations(ratings):
+    """Vectorized get_recommendation of float64 ratings: "S" below zero, "N" at zero, "B" otherwise (including NaN)."""
+    return np.select([ratings < 0, ratings == 0], ["S", "N"], "B")
+
+
+def _with_recommendations(values, recommendations):
+    """Vectorized f"{x} - {recommendation}" of float64 values."""
+    return np.char.add(np.char.add(values.astype(str), " - "), recommendations)
+
+
+def _to_float(series):
+    """Return the float64 values of a column, NaN for the missing and not numeric values."""
+    if not _is_float(series):
+        series = pd.to_numeric(series, errors="coerce")
+    return series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _concat(*parts):
+    """Element-wise concatenation of string arrays, in an object array if any part is one."""
+    if any(part.dtype == object for part in parts):
+        return np.sum([part.astype(object) for part in parts], axis=0)
+    result = parts[0]
+    for part in parts[1:]:
+        result = np.char.add(result, part)
+    return result
+
+
+def _significant(values, digits):
+    """Round float64 values to a number of significant digits."""
+    finite = np.isfinite(values) & (values != 0)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        exponents = np.floor(np.log10(np.abs(values)))
+        decimals = np.clip(np.where(finite, digits - 1 - exponents, 0), -300, 300)
+        scales = 10.0 ** decimals
+        rounded = np.rint(values * scales) / scales
+    return np.where(finite & np.isfinite(rounded), rounded, values)
+
+
+class Beautify:
+    def __init__(self, df, specific_fields: Field, inplace: bool = False, columns=None):
+        """
+        :param df: Screener results, with the labels of the fields as columns
+        :param specific_fields: Type of fields of the results (StockField, ForexField, CryptoField)
+        :param inplace: If True, the columns of df are formatted in place instead of in a copy
+        :param columns: Labels of the columns to format, default is all of them
+        """
+        self.df = df if inplace else df.copy()
+        self._currency_affixes = {}
+
+        # The plan is compiled on all the columns, that the formatted ones may read
+        for method, column, *args in compile_plan(specific_fields, tuple(self.df.columns)):
+            if columns is None or column in columns:
+                getattr(self, method)(column, *args)
+
+    # The formatters work on whole float columns, as float64 arrays: the values are the Python floats the row-wise
+    # versions received. The other columns, e.g. object columns with None, are formatted value by value.
+
+    def _set(self, column, values):
+        self.df[column] = pd.Series(values, index=self.df.index)
 
     def _rating(self, column):
-        self.df[column] = self.df[column].apply(lambda x: Rating.find(x).label)
+        self.df[column] = Rating.classify(self.df[column])
 
-    def _recommendation(self, column, specific_field):
-        self.df[column] = self.df.apply(
-            lambda x: f"{x[column]} - {get_recommendation(x[specific_field.get_rec_label()])}", axis=1)
+    def _recommendation(self, column, rec_column):
+        series, ratings = self.df[column], self.df[rec_column]
+        if _is_float(series) and _is_float(ratings):
+            self._set(column, _with_recommendations(series.to_numpy(dtype=np.float64),
+                                                    _recommendations(ratings.to_numpy(dtype=np.float64))))
+        else:
+            self._set(column, np.array([f"{x} - {get_recommendation(rating)}"
+                                        for x, rating in zip(series.tolist(), ratings.tolist())], dtype=object))
 
     def _number_group(self, column):
-        self.df[column] = self.df[column].apply(lambda x: millify(x))
+        series = self.df[column]
+        if not _is_float(series):
+            self.df[column] = series.apply(lambda x: millify(x))
+            return
+        self._set(column, _millify(series.to_numpy(dtype=np.float64)))
 
     def _percent(self, column):
-        self.df[column] = self.df[column].apply(lambda x: f"{x:.2f}%" if x is not None else None)
+        series = self.df[column]
+        if not _is_float(series):
+            self.df[column] = series.apply(lambda x: f"{x:.2f}%" if x is not None else None)
+            return
+        self._set(column, _format_fixed(series.to_numpy(dtype=np.float64), 2, "%"))
 
     def _round(self, column):
-        self.df[column] = self.df[column].apply(lambda x: round(x, 2) if x is not None else None)
+        series = self.df[column]
+        if not _is_float(series):
+            self.df[column] = series.apply(lambda x: round(x, 2) if x is not None else None)
+            return
+        self._set(column, _round(series.to_numpy(dtype=np.float64), 2))
 
     def _copy_column(self, column):
         raw_name = column + " raw"
@@ -80,5 +328,142 @@ class Beautify:
 
     def _to_bool(self, column):
         # Fixed: Use == for value comparison instead of 'is'
-        self.df[column] = self.df[column].apply(lambda x: True if x == 'true' else False)
-        self.df[column] = self.df[column].astype(bool)
+        self.df[column] = self.df[column].eq('true').fillna(False).astype(bool)
+
+    def _computed_recommendation(self, column, direction, buy_bound, sell_bound):
+        """
+        Format the indicator with its recommendation: "B" or "S" when it is beyond its buy or sell bound, in the
+        direction of the rule (BELOW or ABOVE), "N" otherwise.
+
+        A bound is a number, or the label of the column the indicator is compared to, row by row (e.g. the price).
+        """
+        values = _to_float(self.df[column])
+        buy_bound, sell_bound = (_to_float(self.df[bound]) if isinstance(bound, str) else bound
+                                 for bound in (buy_bound, sell_bound))
+        with np.errstate(invalid="ignore"):
+            if direction == BELOW:
+                conditions = [values < buy_bound, values > sell_bound]
+            else:
+                conditions = [values > buy_bound, values < sell_bound]
+            recommendations = np.select(conditions, ["B", "S"], "N")
+        self._set(column, _with_recommendations(values, recommendations))
+
+    def _currency(self, column, currency_column):
+        """Format the amounts with the symbol, or the code, of the currency of their row: "$1.50", "1.234B CHF"."""
+        values = _to_float(self.df[column])
+        magnitudes = np.abs(values)
+        large = magnitudes >= CURRENCY_MILLIFY_FROM
+        # np.inf is large: millify raises on it, as number_group does
+        amounts = _format_fixed(np.where(large, 0, magnitudes), 2)
+        if large.any():
+            amounts = amounts.astype(object)
+            amounts[large] = _millify(magnitudes[large])
+        prefixes, suffixes = self._get_currency_affixes(currency_column)
+        text = _concat(np.where(np.signbit(values), "-", ""), prefixes, amounts, suffixes).astype(object)
+        text[np.isnan(values)] = None
+        self._set(column, text)
+
+    def _get_currency_affixes(self, currency_column):
+        """Return the (prefixes, suffixes) of the amounts of the rows, computed once per frame."""
+        if currency_column not in self._currency_affixes:
+            prefixes = suffixes = np.full(len(self.df), "")
+            if currency_column is not None:
+                currencies = self.df[currency_column].to_numpy(dtype=object)
+                missing = pd.isna(currencies)
+                codes = np.where(missing, "", currencies).astype(str)
+                # One lookup per distinct currency
+                uniques, inverse = np.unique(codes, return_inverse=True)
+                prefixes = np.array([CURRENCY_SYMBOLS.get(code, "") for code in uniques.tolist()], dtype=str)[inverse]
+                suffixes = np.where((prefixes == "") & ~missing, np.char.add(" ", codes), "")
+            self._currency_affixes[currency_column] = prefixes, suffixes
+        return self._currency_affixes[currency_column]
+
+    def _date(self, column):
+        """Convert the timestamps, in seconds since the epoch, to datetimes (NaT when missing)."""
+        self._set(column, pd.to_datetime(_to_float(self.df[column]), unit="s"))
+
+    def _float(self, column):
+        self._set(column, _significant(_to_float(self.df[column]), FLOAT_SIGNIFICANT_DIGITS))
+
+    def _text(self, column):
+        series = self.df[column]
+        if isinstance(series.dtype, (pd.StringDtype, pd.CategoricalDtype)):
+            return
+        self.df[column] = series.where(series.isna(), series.astype(str))
+
+    def _missing(self, column):
+        # Fields without known format: numbers are formatted as floats, the rest as text
+        if pd.api.types.is_numeric_dtype(self.df[column]) and not pd.api.types.is_bool_dtype(self.df[column]):
+            self._float(column)
+        else:
+            self._text(column)
+
+
+def _get_displayed_columns(columns):
+    """
+    Return the set of the columns that pandas displays: the first and last ones, up to display.max_columns, or up to the
+    width of the terminal if it is 0.
+    """
+    max_columns = pd.get_option("display.max_columns")
+    if max_columns == 0:
+        # Fitted by pandas to the terminal: the columns are at least as wide as their label and a space, so those
+        # fitting by their label are a superset of the displayed ones
+        width = shutil.get_terminal_size().columns
+        widths = [len(str(label)) + 1 for pair in zip(columns, reversed(columns)) for label in pair]
+        max_columns = int(np.searchsorted(np.cumsum(widths), width, side="right"))
+    if max_columns is None or len(columns) <= max_columns:
+        return set(columns)
+    half = max_columns // 2
+    return set(columns[:half]) | set(columns[len(columns) - half:]) if half else set(columns[:max_columns])
+
+
+class BeautifyView:
+    """
+    Screener results formatted at render time. The results are not copied nor converted: each rendering formats the
+    first rows, and only the columns pandas displays.
+    """
+
+    def __init__(self, df, specific_fields: Field, max_rows: int = DISPLAY_ROWS):
+        """
+        :param df: Screener results, with the labels of the fields as columns
+        :param specific_fields: Type of fields of the results (StockField, ForexField, CryptoField)
+        :param max_rows: Number of rows rendered
+        """
+        if max_rows < 0:
+            raise ValueError(f"max_rows must not be negative: {max_rows}")
+        self.df = df
+        self.specific_fields = specific_fields
+        self.max_rows = max_rows
+
+    def head(self, n: int = None):
+        """
+        Return the first rows, formatted.
+
+        :param n: Number of rows, default is max_rows
+        :return: DataFrame of the n first rows, with all the columns formatted
+        """
+        n = self.max_rows if n is None else n
+        return Beautify(self.df.head(n), self.specific_fields, inplace=True).df
+
+    def _render(self):
+        head = self.df.head(self.max_rows)
+        return Beautify(head, self.specific_fields, inplace=True, columns=_get_displayed_columns(head.columns)).df
+
+    def _footer(self):
+        # The dimensions of the results, instead of the ones of the rendered rows
+        return f"[{len(self.df)} rows x {len(self.df.columns)} columns]"
+
+    def __len__(self):
+        return len(self.df)
+
+    def __repr__(self):
+        if len(self.df) <= self.max_rows:
+            return repr(self._render())
+        with pd.option_context("display.show_dimensions", False):
+            return f"{self._render()!r}\n\n{self._footer()}"
+
+    def _repr_html_(self):
+        if len(self.df) <= self.max_rows:
+            return self._render()._repr_html_()
+        with pd.option_context("display.show_dimensions", False):
+            return f"{self._render()._repr_html_()}<p>{self._footer()}</p>"
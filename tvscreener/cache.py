@@ -0,0 +1,348 @@
+import hashlib
+import json
+import os
+import pickle
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+from tvscreener.field import TimeInterval
+
+# Configuration constants
+DEFAULT_TTL = 60  # seconds
+DEFAULT_MAX_ENTRIES = 128
+DEFAULT_MAX_DISK_BYTES = 1024 ** 3
+SQLITE_TIMEOUT = 30  # seconds a process waits for the lock held by another one
+DEFAULT_SLACK = 5  # seconds added after the bar close, for the scanner to publish the new bar
+UPDATE_MODE_LABEL = "Update Mode"
+DAY = 24 * 60 * 60
+
+
+def make_key(url, payload) -> str:
+    """
+    Build the cache key of a request from its url and payload.
+
+    The serialized payloads of the screeners are deterministic, so a JSON string is hashed as is, without being
+    decoded. A dict is hashed in its canonical JSON form, which is not the same key as its serialized form.
+
+    :param url: Url of the request
+    :param payload: Payload of the request, as a dict or as a JSON string
+    :return: Hexadecimal SHA-256 digest of the url and of the payload
+    """
+    if isinstance(payload, str):
+        payload = payload.encode()
+    elif not isinstance(payload, bytes):
+        payload = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.sha256(f"{url}\n".encode() + payload).hexdigest()
+
+
+def _copy(df):
+    import pandas as pd
+    # With copy-on-write (always on since pandas 3), a shallow copy is enough to protect the cached frame
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return df.copy(deep=False)
+    try:
+        copy_on_write = pd.get_option("mode.copy_on_write") is True
+    except KeyError:
+        # The option does not exist before pandas 1.5 (OptionError subclasses KeyError in every version)
+        copy_on_write = False
+    return df.copy(deep=not copy_on_write)
+
+
+def _resolve_ttl(policy, ttl, time_interval, value):
+    if ttl is not None:
+        return ttl
+    return policy(time_interval, value) if callable(policy) else policy
+
+
+def next_bar_boundary(time_interval: TimeInterval, now: float, offset: float = 0) -> float:
+    """
+    Return the timestamp at which the bar of the time interval containing now closes.
+
+    Intraday and daily bars are aligned on multiples of their duration from offset seconds after UTC midnight, and
+    weekly bars on Monday at the same time.
+
+    :param time_interval: Time interval of the bar
+    :param now: Timestamp in the bar
+    :param offset: Seconds from UTC midnight to the session open the bars are anchored to, 0 for UTC-aligned bars
+        (crypto). E.g. the 60 minute bars of US stocks start at 9:30 New York time: 13:30 UTC in summer, 48600
+    """
+    if time_interval == TimeInterval.ONE_DAY:
+        period = DAY
+    elif time_interval == TimeInterval.ONE_WEEK:
+        # The epoch is a Thursday, the first Monday is 4 days later
+        period, offset = 7 * DAY, 4 * DAY + offset
+    else:
+        period = int(time_interval.value) * 60
+    return ((now - offset) // period + 1) * period + offset
+
+
+def get_session_offset(session, now: float) -> float:
+    """
+    Return the offset of a session open from UTC midnight, on the day of now, daylight saving time included.
+
+    :param session: (opening time "HH:MM", IANA time zone), e.g. ("09:30", "America/New_York")
+    :param now: Timestamp of the day
+    :return: Offset in seconds, in [0, 1 day)
+    """
+    from datetime import datetime
+    from zoneinfo import ZoneInfo
+    opening, time_zone = session
+    hours, minutes = map(int, opening.split(":"))
+    local = datetime.fromtimestamp(now, ZoneInfo(time_zone))
+    return local.replace(hour=hours, minute=minutes, second=0, microsecond=0).timestamp() % DAY
+
+
+def get_update_delay(df) -> int:
+    """
+    Return the data delay, in seconds, reported by the update mode columns of the result (e.g. delayed_streaming_900).
+    """
+    columns = [column for column in df.columns
+               if (column[0] if isinstance(column, tuple) else column) == UPDATE_MODE_LABEL]
+    delays = [int(match.group(1)) for column in columns for mode in df[column].dropna().unique()
+              if (match := re.search(r"_(\d+)$", str(mode)))]
+    return max(delays, default=0)
+
+
+class BarExpiry:
+    """
+    Cache expiry policy ending the entries when the current bar of the requested time interval closes.
+
+    Use it as the ttl of a ResponseCache, so that a 1-minute screen expires after the next minute bar closes while a
+    daily screen stays cached until the end of the day.
+
+    Without session, the bars are assumed to be aligned on UTC: intraday bars on UTC multiples of their duration and
+    daily bars on UTC midnight, as the crypto bars. The bars of an exchange are anchored to its session open: give the
+    session of the screened market, e.g. ("09:30", "America/New_York") for US stocks, whose 60 minute bars close at
+    10:30, 11:30... New York time, otherwise the results may be served up to a bar late.
+    """
+
+    def __init__(self, slack: float = DEFAULT_SLACK, max_ttl: float = None, session: tuple = None):
+        """
+        :param slack: Seconds added after the bar close
+        :param max_ttl: Maximum time to live, in seconds (default is no limit)
+        :param session: (opening time "HH:MM", IANA time zone) the bars are anchored to, default is UTC midnight
+        :raises ValueError: If the opening time is not "HH:MM"
+        :raises zoneinfo.ZoneInfoNotFoundError: If the time zone is unknown
+        """
+        if session is not None:
+            # Checked here rather than on the first result
+            if not re.fullmatch(r"\d{1,2}:\d{2}", session[0]):
+                raise ValueError(f"Invalid session opening time: {session[0]}, expected HH:MM")
+            get_session_offset(session, 0)
+        self.slack = slack
+        self.max_ttl = max_ttl
+        self.session = session
+
+    def __call__(self, time_interval, df=None, now: float = None) -> float:
+        """
+        Return the time to live of a result.
+
+        :param time_interval: Time interval, or list of time intervals, of the request
+        :param df: Result of the request, used to account for delayed data
+        :param now: Current timestamp (default is time.time())
+        :return: Time to live, in seconds
+        """
+        now = time.time() if now is None else now
+        time_intervals = [time_interval] if isinstance(time_interval, TimeInterval) else time_interval
+        # Delayed data only moves to the next bar once the delay has elapsed after the close
+        delay = get_update_delay(df) if df is not None else 0
+        offset = 0 if self.session is None else get_session_offset(self.session, now - delay)
+        ttl = min(next_bar_boundary(interval, now - delay, offset) + delay
+                  for interval in time_intervals) - now + self.slack
+        return ttl if self.max_ttl is None else min(ttl, self.max_ttl)
+
+
+class ResponseCache:
+    """
+    In-memory cache of screener results with a per-entry TTL and LRU eviction.
+
+    Entries are evicted, least recently used first, when the cache holds more than max_entries results or more than
+    max_bytes of data. The cache is thread-safe and can be shared by several screeners.
+    """
+
+    def __init__(self, ttl: float | BarExpiry = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_bytes: int = None):
+        """
+        :param ttl: Time to live of the entries, in seconds, or an expiry policy such as BarExpiry
+        :param max_entries: Maximum number of entries
+        :param max_bytes: Maximum memory used by the cached results (default is no limit)
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size_bytes = 0
+
+        self._entries = OrderedDict()  # key -> (expires_at, value, size)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        Return a copy of the cached result, or None if the key is missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.time():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[1]
+        return _copy(value)
+
+    def set(self, key, value, ttl: float = None, time_interval=TimeInterval.ONE_DAY):
+        """
+        Cache a copy of the result.
+
+        :param key: Cache key, see make_key
+        :param value: ScreenerDataFrame to cache
+        :param ttl: Time to live of the entry, in seconds (default is given by the ttl of the cache)
+        :param time_interval: Time interval of the request, used by the expiry policy
+        """
+        ttl = _resolve_ttl(self.ttl, ttl, time_interval, value)
+        if ttl <= 0:
+            return
+        value = _copy(value)
+        size = int(value.memory_usage(deep=self.max_bytes is not None).sum())
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.time() + ttl, value, size)
+            self.size_bytes += size
+            while len(self._entries) > self.max_entries or \
+                    (self.max_bytes is not None and self.size_bytes > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "entries": len(self._entries), "size_bytes": self.size_bytes}
+
+    def _remove(self, key):
+        self.size_bytes -= self._entries.pop(key)[2]
+
+
+class DiskCache:
+    """
+    On-disk cache of screener results, stored in a SQLite database shared by any number of processes.
+
+    The results are stored as compressed pickles of the frames, so that hits skip both the network and the decoding
+    of the response. Only point the cache to a file that other users cannot write to.
+    Entries are evicted, least recently used first, when the database holds more than max_bytes of data.
+    """
+
+    def __init__(self, path, ttl: float | BarExpiry = DEFAULT_TTL, max_bytes: int = DEFAULT_MAX_DISK_BYTES):
+        """
+        :param path: Path of the SQLite database, created if it does not exist
+        :param ttl: Time to live of the entries, in seconds, or an expiry policy such as BarExpiry
+        :param max_bytes: Maximum size of the stored results
+        """
+        self.path = os.fspath(path)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, expires_at REAL NOT NULL, "
+                               "accessed_at REAL NOT NULL, size INTEGER NOT NULL, value BLOB NOT NULL)")
+
+    def _connect(self):
+        # SQLite connections cannot be shared between threads: one connection per thread
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=SQLITE_TIMEOUT)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def __len__(self):
+        return self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, key):
+        """
+        Return the cached result, or None if the key is missing or expired.
+        """
+        now = time.time()
+        with self._connect() as connection:
+            row = connection.execute("SELECT value FROM entries WHERE key = ? AND expires_at > ?",
+                                     (key, now)).fetchone()
+            if row is not None:
+                connection.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+        self._count(row is not None)
+        return pickle.loads(zlib.decompress(row[0])) if row is not None else None
+
+    def set(self, key, value, ttl: float = None, time_interval=TimeInterval.ONE_DAY):
+        """
+        Store the result.
+
+        :param key: Cache key, see make_key
+        :param value: ScreenerDataFrame to cache
+        :param ttl: Time to live of the entry, in seconds (default is given by the ttl of the cache)
+        :param time_interval: Time interval of the request, used by the expiry policy
+        """
+        ttl = _resolve_ttl(self.ttl, ttl, time_interval, value)
+        if ttl <= 0:
+            return
+        blob = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), 1)
+        if len(blob) > self.max_bytes:
+            return
+
+        now = time.time()
+        # The insertion and the eviction are done in the same transaction
+        with self._connect() as connection:
+            connection.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                               (key, now + ttl, now, len(blob), blob))
+            connection.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+            connection.execute("DELETE FROM entries WHERE key IN (SELECT key FROM (SELECT key, SUM(size) OVER "
+                               "(ORDER BY accessed_at DESC, key) AS total FROM entries) WHERE total > ?)",
+                               (self.max_bytes,))
+
+    def clear(self):
+        with self._connect() as connection:
+            connection.execute("DELETE FROM entries")
+
+    def stats(self) -> dict:
+        entries, size_bytes = self._connect().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {"hits": self.hits, "misses": self.misses, "entries": entries, "size_bytes": size_bytes}
+
+    def close(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
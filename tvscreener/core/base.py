@@ -1,15 +1,25 @@
-import json
-import pandas as pd
+import copy
+import gzip
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 import requests
 from enum import Enum
 
+from tvscreener.backends import BACKENDS, to_arrow, to_polars, to_records
+from tvscreener.cache import ResponseCache, DiskCache, make_key
 from tvscreener.exceptions import MalformedRequestException
 from tvscreener.field import TimeInterval, Field, Market
 from tvscreener.field.crypto import CryptoField
 from tvscreener.field.forex import ForexField
 from tvscreener.field.stock import StockField
 from tvscreener.filter import FilterOperator, Filter, ExtraFilter
-from tvscreener.util import get_columns_to_request, is_status_code_ok
+from tvscreener.json_backends import dumps, loads, resolve_json_backend
+from tvscreener.session import ScreenerSession, AsyncScreenerSession, get_default_session
+from tvscreener.singleflight import SingleFlight, get_default_single_flight
+from tvscreener.streaming import DEFAULT_CHUNK_SIZE, StreamDecoder
+from tvscreener.util import get_columns_to_request, get_columns_to_request_by_interval, is_status_code_ok, \
+    get_response_columns, get_compact_dtypes
 
 # Configuration constants
 DEFAULT_MARKET = Market.AMERICA
@@ -19,6 +29,11 @@ DEFAULT_SORT_STOCKS = StockField.MARKET_CAPITALIZATION
 DEFAULT_SORT_CRYPTO = CryptoField.VOLUME_24H_IN_USD
 DEFAULT_SORT_FOREX = ForexField.NAME
 REQUEST_TIMEOUT = 30  # seconds
+DEFAULT_CONCURRENCY = 10  # requests in flight for the concurrent helpers
+DEFAULT_PAGE_SIZE = 1000  # rows per range window when fetching the whole result set
+DEFAULT_PREFETCH = 2  # range windows fetched ahead of the page being processed by iter_pages
+REQUEST_COMPRESSIONS = (None, "gzip")
+GZIP_LEVEL = 6
 
 # Backward compatibility aliases
 default_market = DEFAULT_MARKET
@@ -29,37 +44,31 @@ default_sort_crypto = DEFAULT_SORT_CRYPTO
 default_sort_forex = DEFAULT_SORT_FOREX
 
 
-class ScreenerDataFrame(pd.DataFrame):
-    def __init__(self, data, columns: dict, *args, **kwargs):
-        # Add the extra received columns
-        columns = {"symbol": "Symbol", **columns}
-        super().__init__(data, columns=list(columns.values()), *args, **kwargs)
-
-        # Reorder columns
-        first_columns = ['symbol', 'name', 'description']
-        ordered_columns = {k: columns.get(k) for k in first_columns}
-        ordered_columns.update({k: v for k, v in columns.items() if k not in first_columns})
-        self.attrs['original_columns'] = ordered_columns
-        self._update_inplace(self[ordered_columns.values()])
-
-    def set_technical_columns(self, only: bool = False):
-        if only:
-            self.columns = pd.Index(self.attrs['original_columns'].keys())
-        else:
-            self.columns = pd.MultiIndex.from_tuples(self.attrs['original_columns'].items())
-
-
 class Screener:
     """Base screener class for querying TradingView screeners."""
 
-    def __init__(self):
+    def __init__(self, session: ScreenerSession = None):
+        """
+        :param session: HTTP session used to query the scanner (default is the session shared by all screeners)
+        """
+        self.session = session if session is not None else get_default_session()
         self.sort = None
+        self.sort_field = None
         self.url = None
         self.filters = []
         self.options = {}
         self.symbols = None
         self.misc = {}
         self.specific_fields = None
+        self.selected_fields = None
+        self.cache = None
+        self.single_flight = get_default_single_flight()
+        self.json_backend = "json"
+        self.streaming = False
+        self.request_compression = None
+        self._payloads = {}  # time interval -> (fingerprint, columns, payload_json)
+        self._body = None  # (payload_json, compression, body, headers) of the last request
+        self._cache_key = None  # (url, payload_json, cache key) of the last cached request
 
         self.range = None
         self.set_range()
@@ -72,6 +81,54 @@ class Screener:
     #    filter_val = {"left": filter_, "operation": operation.value, "right": values}
     #    self.filters.append(filter_val)
 
+    def set_cache(self, cache: ResponseCache | DiskCache) -> None:
+        """
+        Set the cache of the results returned by get and aget.
+
+        :param cache: Cache to use, possibly shared with other screeners, or None to disable caching
+        """
+        self.cache = cache
+
+    def set_single_flight(self, single_flight: SingleFlight) -> None:
+        """
+        Set the group coalescing identical concurrent requests.
+
+        :param single_flight: Group to use, possibly shared with other screeners, or None to disable coalescing
+        """
+        self.single_flight = single_flight
+
+    def set_json_backend(self, json_backend: str) -> None:
+        """
+        Set the library serializing the payloads and deserializing the responses.
+
+        :param json_backend: "json", "orjson", "msgspec", or "auto" for the fastest installed one
+        :raises ValueError: If the backend is unknown
+        :raises ImportError: If the backend is not installed
+        """
+        self.json_backend = resolve_json_backend(json_backend)
+
+    def set_streaming(self, streaming: bool) -> None:
+        """
+        Decode the responses of get while they are downloaded, straight into columns.
+
+        The rows are parsed chunk by chunk, so the peak memory of large responses is lower and the decoding overlaps
+        with the download. Streaming does not apply to the records backend, nor to the async and paginated methods.
+
+        :param streaming: True to stream-decode the responses
+        """
+        self.streaming = streaming
+
+    def set_request_compression(self, compression: str | None) -> None:
+        """
+        Set the compression of the request bodies.
+
+        :param compression: "gzip" to send gzip-compressed payloads, or None to send them as is
+        :raises ValueError: If the compression is unknown
+        """
+        if compression not in REQUEST_COMPRESSIONS:
+            raise ValueError(f"Unknown compression: {compression}, expected one of {REQUEST_COMPRESSIONS}")
+        self.request_compression = compression
+
     def search(self, value: str):
         self.add_filter(ExtraFilter.SEARCH, FilterOperator.MATCH, value)
 
@@ -119,8 +176,32 @@ class Screener:
         self.range = [from_range, to_range]
 
     def sort_by(self, sort_by: Field, ascending=True):
+        self.sort_field = sort_by
         self.sort = {"sortBy": sort_by.field_name, "sortOrder": "asc" if ascending else "desc"}
 
+    def select(self, *fields: Field):
+        """
+        Restrict the requested columns to the given fields.
+
+        The name and description, as well as the sort and filter fields, are always requested.
+        Calling select without any field requests all the fields again.
+
+        :param fields: Fields to request
+        :raises ValueError: If a field does not belong to the fields of this screener
+        """
+        unknown_fields = [field for field in fields if not isinstance(field, self.specific_fields)]
+        if unknown_fields:
+            raise ValueError(f"Unknown fields for {self.specific_fields.__name__}: {unknown_fields}")
+        self.selected_fields = list(fields) if fields else None
+
+    def _get_selected_fields(self):
+        """Return the set of fields to request, or None to request all of them."""
+        if self.selected_fields is None:
+            return None
+        required = [self.specific_fields.NAME, self.specific_fields.DESCRIPTION, self.sort_field]
+        required += [filter_.field for filter_ in self.filters if isinstance(filter_.field, self.specific_fields)]
+        return frozenset(self.selected_fields).union(field for field in required if field is not None)
+
     def _build_payload(self, requested_columns_):
         payload = {
             "filter": [f.to_dict() for f in self.filters],
@@ -133,39 +214,150 @@ class Screener:
         }
         return payload
 
-    def get(self, time_interval=TimeInterval.ONE_DAY, print_request=False):
+    def warmup(self, connections: int = 1) -> int:
         """
-        Get the screener data from TradingView.
+        Pre-open keep-alive connections to the scanner so that the next requests skip the TCP and TLS handshake.
 
-        :param time_interval: The time interval for the data (default is ONE_DAY).
-        :param print_request: If True, prints the request URL and payload for debugging.
-        :return: ScreenerDataFrame containing the screener results
-        :raises MalformedRequestException: If the API request fails
-        :raises requests.RequestException: If there's a network error
+        :param connections: Number of connections to open
+        :return: Number of connections successfully opened
+        """
+        return self.session.warmup(self.url, connections)
+
+    def _prepare_request(self, time_interval, **overrides):
         """
-        # Build columns
-        columns = get_columns_to_request(self.specific_fields, time_interval)
+        Build the columns and the compact serialized payload, with some payload entries optionally overridden.
 
+        Without overrides, the payload is serialized once per time interval and reused as long as the fingerprint of
+        the screener is unchanged: the attributes and their containers may be modified in place, e.g. filters.append.
+        """
+        key = tuple(time_interval) if isinstance(time_interval, list) else time_interval
+        selected_fields = self._get_selected_fields()
+        fingerprint = None
+        if not overrides:
+            # The payload without its columns, which are derived from the fields and the time interval. It shares
+            # the containers of the screener, so it is compared to a deep copy, only made when the payload changes
+            fingerprint = self._build_payload(None), selected_fields, self.json_backend
+            cached = self._payloads.get(key)
+            if cached is not None and cached[0] == fingerprint:
+                return cached[1:]
+        if isinstance(time_interval, TimeInterval):
+            columns = get_columns_to_request(self.specific_fields, time_interval, selected_fields)
+        else:
+            columns = get_columns_to_request_by_interval(self.specific_fields, time_interval, selected_fields)
         payload = self._build_payload(list(columns.keys()))
-        payload_json = json.dumps(payload, indent=4)
+        payload.update(overrides)
+        payload_json = dumps(payload, self.json_backend)
+        if not overrides:
+            self._payloads[key] = copy.deepcopy(fingerprint), columns, payload_json
+        return columns, payload_json
 
-        if print_request:
-            print(f"Request: {self.url}")
-            print("Payload:")
-            print(payload_json)
+    def _encode_body(self, payload_json):
+        """Return the body and the headers of the request, the last encoded body being reused for the same payload."""
+        body = self._body
+        if body is None or body[0] != payload_json or body[1] != self.request_compression:
+            data = payload_json.encode()
+            if self.request_compression == "gzip":
+                body = (payload_json, self.request_compression, gzip.compress(data, GZIP_LEVEL, mtime=0),
+                        {"Content-Encoding": "gzip"})
+            else:
+                body = payload_json, self.request_compression, data, None
+            self._body = body
+        return body[2], body[3]
+
+    def _cache_get(self, payload_json, backend="pandas"):
+        """Return the cache key of the payload and its cached result, if any. Only pandas results are cached."""
+        if self.cache is None or backend != "pandas":
+            return None, None
+        # The key of the last payload is reused, as the payload itself
+        memo = self._cache_key
+        if memo is None or memo[0] != self.url or memo[1] != payload_json:
+            memo = self._cache_key = self.url, payload_json, make_key(self.url, payload_json)
+        return memo[2], self.cache.get(memo[2])
+
+    def _cache_set(self, cache_key, df, time_interval):
+        if cache_key is not None:
+            self.cache.set(cache_key, df, time_interval=time_interval)
+
+    def _print_request(self, payload_json):
+        print(f"Request: {self.url}")
+        print("Payload:")
+        print(dumps(loads(payload_json), indent=4))
+
+    @staticmethod
+    def _get_windows(total_count, page_size, start=0):
+        """Split [start, total_count) into consecutive range windows of page_size rows."""
+        return [(from_range, min(from_range + page_size, total_count))
+                for from_range in range(start, total_count, page_size)]
+
+    @staticmethod
+    def _check_result_options(dtypes, backend):
+        """
+        :raises ValueError: If dtypes or backend is unknown, or if dtypes is used with another backend than pandas
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}, expected one of {BACKENDS}")
+        if dtypes not in (None, "compact"):
+            raise ValueError(f"Unknown dtypes: {dtypes}, expected None or 'compact'")
+        if dtypes is not None and backend != "pandas":
+            raise ValueError(f"dtypes is only supported by the pandas backend, not by {backend}")
 
+    def _apply_dtypes(self, df, dtypes):
+        """
+        Convert the columns of the result in a single pass.
+
+        :param df: ScreenerDataFrame to convert
+        :param dtypes: None to keep the inferred dtypes, or "compact" for the dtypes derived from the field formats
+        :return: the converted ScreenerDataFrame
+        """
+        if dtypes is None:
+            return df
+        return df.astype(get_compact_dtypes(self.specific_fields, df))
+
+    @staticmethod
+    def _to_dataframe(response_json, columns):
+        # pandas is only imported by the screeners returning pandas results
+        from tvscreener.core.dataframe import ScreenerDataFrame
+        # Decoded column by column: no list per row, and numeric columns are built straight from arrays
+        data = dict(zip(["symbol", *columns], get_response_columns(response_json, len(columns))))
+        return ScreenerDataFrame(data, columns)
+
+    def _to_result(self, response_json, columns, dtypes=None, backend="pandas"):
+        """Decode the response with the given backend."""
+        if backend == "arrow":
+            return to_arrow(response_json, columns)
+        if backend == "polars":
+            return to_polars(response_json, columns)
+        if backend == "records":
+            return to_records(response_json, columns)
+        return self._apply_dtypes(self._to_dataframe(response_json, columns), dtypes)
+
+    def _post(self, payload_json, width=None):
+        """
+        Send the payload to the scanner and return the decoded JSON response.
+
+        Identical concurrent requests are coalesced, so the response may be shared and must not be modified.
+
+        :param width: Number of columns requested, to stream-decode the response into "columns" instead of "data"
+            rows, or None to decode the whole body at once
+        """
+        if self.single_flight is None:
+            return self._send(payload_json, width)
+        return self.single_flight.do((self.url, payload_json, width), self._send, payload_json, width)
+
+    def _send(self, payload_json, width=None):
         try:
             # Fixed: Add timeout to prevent hanging indefinitely
-            response = requests.post(
-                self.url,
-                data=payload_json,
-                timeout=REQUEST_TIMEOUT,
-                headers={'Content-Type': 'application/json'}
-            )
+            data, headers = self._encode_body(payload_json)
+            if width is None:
+                response = self.session.post(self.url, data=data, timeout=REQUEST_TIMEOUT, headers=headers)
+            else:
+                response = self.session.post(self.url, data=data, timeout=REQUEST_TIMEOUT, headers=headers,
+                                             stream=True)
 
             if is_status_code_ok(response):
-                data = [[d["s"]] + d["d"] for d in response.json()['data']]
-                return ScreenerDataFrame(data, columns)
+                if width is not None:
+                    return self._stream_decode(response, width)
+                return loads(response.content, self.json_backend)
             else:
                 raise MalformedRequestException(
                     response.status_code,
@@ -188,3 +380,277 @@ class Screener:
                 self.url,
                 payload_json
             )
+
+    @staticmethod
+    def _stream_decode(response, width):
+        decoder = StreamDecoder(width)
+        with response:
+            for chunk in response.iter_content(DEFAULT_CHUNK_SIZE):
+                decoder.feed(chunk)
+        return decoder.close()
+
+    async def _apost(self, payload_json, session: AsyncScreenerSession):
+        """Async twin of _post."""
+        if self.single_flight is None:
+            return await self._asend(payload_json, session)
+        return await self.single_flight.ado((self.url, payload_json), self._asend, payload_json, session)
+
+    async def _asend(self, payload_json, session: AsyncScreenerSession):
+        data, headers = self._encode_body(payload_json)
+        try:
+            status_code, body = await session.post(self.url, data=data, timeout=REQUEST_TIMEOUT, headers=headers)
+        except MalformedRequestException as e:
+            # Reported with the payload, not with the encoded body
+            raise MalformedRequestException(e.code, e.response_msg, self.url, payload_json) from None
+        if status_code < 400:
+            return loads(body, self.json_backend)
+        raise MalformedRequestException(status_code, body.decode(errors="replace"), self.url, payload_json)
+
+    def get(self, time_interval=TimeInterval.ONE_DAY, print_request=False, dtypes=None, backend="pandas"):
+        """
+        Get the screener data from TradingView.
+
+        :param time_interval: The time interval for the data (default is ONE_DAY). With a list of time intervals,
+            all of them are fetched in a single request and the columns are indexed by (label, time interval).
+        :param print_request: If True, prints the request URL and payload for debugging.
+        :param dtypes: "compact" to convert the columns to memory-compact dtypes derived from the field formats
+            (float32, nullable booleans, categories, strings), or None to keep the inferred dtypes
+        :param backend: "pandas" for a ScreenerDataFrame, "arrow" for a pyarrow Table, "polars" for a polars
+            DataFrame or "records" for a list of dicts, decoded without pandas. Only the pandas results are cached.
+        :return: ScreenerDataFrame containing the screener results, or a pyarrow Table, polars DataFrame or records
+        :raises MalformedRequestException: If the API request fails
+        :raises requests.RequestException: If there's a network error
+        """
+        self._check_result_options(dtypes, backend)
+        columns, payload_json = self._prepare_request(time_interval)
+
+        if print_request:
+            self._print_request(payload_json)
+
+        cache_key, df = self._cache_get(payload_json, backend)
+        if df is None:
+            # The records are built from the rows, they are not streamed into columns
+            width = len(columns) if self.streaming and backend != "records" else None
+            df = self._to_result(self._post(payload_json, width), columns, backend=backend)
+            self._cache_set(cache_key, df, time_interval)
+        return self._apply_dtypes(df, dtypes)
+
+    async def aget(self, time_interval=TimeInterval.ONE_DAY, print_request=False,
+                   session: AsyncScreenerSession = None, dtypes=None, backend="pandas"):
+        """
+        Get the screener data from TradingView without blocking the event loop.
+
+        :param time_interval: The time interval for the data (default is ONE_DAY).
+        :param print_request: If True, prints the request URL and payload for debugging.
+        :param session: Async HTTP session to use (default is a session opened for this call only)
+        :param dtypes: "compact" for memory-compact dtypes, see get
+        :param backend: "pandas", "arrow", "polars" or "records", see get
+        :return: ScreenerDataFrame containing the screener results, or a pyarrow Table, polars DataFrame or records
+        :raises MalformedRequestException: If the API request fails
+        """
+        self._check_result_options(dtypes, backend)
+        columns, payload_json = self._prepare_request(time_interval)
+
+        if print_request:
+            self._print_request(payload_json)
+
+        cache_key, df = self._cache_get(payload_json, backend)
+        if df is not None:
+            return self._apply_dtypes(df, dtypes)
+
+        if session is None:
+            async with AsyncScreenerSession() as session:
+                response_json = await self._apost(payload_json, session)
+        else:
+            response_json = await self._apost(payload_json, session)
+        df = self._to_result(response_json, columns, backend=backend)
+        self._cache_set(cache_key, df, time_interval)
+        return self._apply_dtypes(df, dtypes)
+
+    def get_all(self, time_interval=TimeInterval.ONE_DAY, page_size: int = DEFAULT_PAGE_SIZE,
+                max_workers: int = DEFAULT_CONCURRENCY, print_request=False, dtypes=None, backend="pandas"):
+        """
+        Get the whole result set, ignoring the range set with set_range.
+
+        The first page gives the total count of results, the remaining pages are then fetched concurrently and
+        stitched together in the server sort order.
+
+        :param time_interval: The time interval for the data (default is ONE_DAY).
+        :param page_size: Number of rows requested per range window
+        :param max_workers: Maximum number of requests in flight at the same time
+        :param print_request: If True, prints the request URL and payload of the first page for debugging.
+        :param dtypes: "compact" for memory-compact dtypes, see get
+        :param backend: "pandas", "arrow", "polars" or "records", see get
+        :return: ScreenerDataFrame containing all the screener results, or a pyarrow Table, polars DataFrame or
+            records
+        :raises MalformedRequestException: If one of the API requests fails
+        """
+        self._check_result_options(dtypes, backend)
+        self._check_page_size(page_size)
+        columns, payload_json = self._prepare_request(time_interval, range=[0, page_size])
+
+        if print_request:
+            self._print_request(payload_json)
+
+        first_page = self._post(payload_json)
+        windows = self._get_windows(first_page['totalCount'], page_size, start=page_size)
+
+        def _fetch(window):
+            return self._post(self._prepare_request(time_interval, range=list(window))[1])
+
+        data = list(first_page['data'])
+        if windows:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for page in executor.map(_fetch, windows):
+                    data.extend(page['data'])
+        return self._to_result({'data': data}, columns, dtypes, backend)
+
+    def _to_page(self, response_json, columns, start, dtypes, backend):
+        page = self._to_result(response_json, columns, dtypes, backend)
+        if backend == "pandas":
+            # Indexed by position in the whole result set, as the result of get_all
+            page.index = range(start, start + len(page))
+        return page
+
+    @staticmethod
+    def _check_page_size(page_size):
+        if page_size < 1:
+            raise ValueError(f"page_size must be at least 1, got {page_size}")
+
+    @staticmethod
+    def _check_prefetch(prefetch):
+        if prefetch < 1:
+            raise ValueError(f"prefetch must be at least 1, got {prefetch}")
+
+    def iter_pages(self, time_interval=TimeInterval.ONE_DAY, page_size: int = DEFAULT_PAGE_SIZE,
+                   prefetch: int = DEFAULT_PREFETCH, print_request=False, dtypes=None, backend="pandas"):
+        """
+        Iterate over the whole result set, one range window at a time, ignoring the range set with set_range.
+
+        Each page is yielded as soon as it arrives, while the next prefetch windows are fetched in the background:
+        at most prefetch + 1 pages are held in memory, whatever the size of the result set.
+
+        :param time_interval: The time interval for the data (default is ONE_DAY).
+        :param page_size: Number of rows requested per range window
+        :param prefetch: Number of windows fetched ahead of the page being processed
+        :param print_request: If True, prints the request URL and payload of the first page for debugging.
+        :param dtypes: "compact" for memory-compact dtypes, see get
+        :param backend: "pandas", "arrow", "polars" or "records", see get
+        :return: Iterator of ScreenerDataFrame pages (or of results of the given backend), in the server sort order
+        :raises MalformedRequestException: If one of the API requests fails
+        """
+        self._check_result_options(dtypes, backend)
+        self._check_page_size(page_size)
+        self._check_prefetch(prefetch)
+        return self._iter_pages(time_interval, page_size, prefetch, print_request, dtypes, backend)
+
+    def _iter_pages(self, time_interval, page_size, prefetch, print_request, dtypes, backend):
+        columns, payload_json = self._prepare_request(time_interval, range=[0, page_size])
+
+        if print_request:
+            self._print_request(payload_json)
+
+        first_page = self._post(payload_json)
+        windows = iter(self._get_windows(first_page['totalCount'], page_size, start=page_size))
+
+        def _fetch(window):
+            return self._post(self._prepare_request(time_interval, range=list(window))[1])
+
+        executor = ThreadPoolExecutor(max_workers=prefetch)
+        pending = deque((window, executor.submit(_fetch, window)) for window in islice(windows, prefetch))
+        try:
+            yield self._to_page(first_page, columns, 0, dtypes, backend)
+            while pending:
+                window, future = pending.popleft()
+                page = future.result()
+                next_window = next(windows, None)
+                if next_window is not None:
+                    pending.append((next_window, executor.submit(_fetch, next_window)))
+                yield self._to_page(page, columns, window[0], dtypes, backend)
+        finally:
+            # The windows not yet fetched are dropped when the iteration is stopped early
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def aiter_pages(self, time_interval=TimeInterval.ONE_DAY, page_size: int = DEFAULT_PAGE_SIZE,
+                    prefetch: int = DEFAULT_PREFETCH, print_request=False, dtypes=None, backend="pandas",
+                    session: AsyncScreenerSession = None):
+        """
+        Async twin of iter_pages, to be used with async for.
+
+        :param session: Async HTTP session to use (default is a session opened for the iteration only)
+        :return: Async iterator of ScreenerDataFrame pages (or of results of the given backend)
+        :raises MalformedRequestException: If one of the API requests fails
+        """
+        self._check_result_options(dtypes, backend)
+        self._check_page_size(page_size)
+        self._check_prefetch(prefetch)
+        return self._aiter_pages(time_interval, page_size, prefetch, print_request, dtypes, backend, session)
+
+    async def _aiter_pages(self, time_interval, page_size, prefetch, print_request, dtypes, backend, session):
+        import asyncio
+        owned_session = session is None
+        if owned_session:
+            session = AsyncScreenerSession()
+
+        pending = deque()
+        try:
+            columns, payload_json = self._prepare_request(time_interval, range=[0, page_size])
+
+            if print_request:
+                self._print_request(payload_json)
+
+            first_page = await self._apost(payload_json, session)
+            windows = iter(self._get_windows(first_page['totalCount'], page_size, start=page_size))
+
+            async def _fetch(window):
+                return await self._apost(self._prepare_request(time_interval, range=list(window))[1], session)
+
+            pending.extend((window, asyncio.ensure_future(_fetch(window))) for window in islice(windows, prefetch))
+            yield self._to_page(first_page, columns, 0, dtypes, backend)
+            while pending:
+                window, task = pending.popleft()
+                page = await task
+                next_window = next(windows, None)
+                if next_window is not None:
+                    pending.append((next_window, asyncio.ensure_future(_fetch(next_window))))
+                yield self._to_page(page, columns, window[0], dtypes, backend)
+        finally:
+            tasks = [task for _, task in pending]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if owned_session:
+                await session.close()
+
+
+async def gather_screens(*screeners: Screener, limit: int = DEFAULT_CONCURRENCY, session: AsyncScreenerSession = None,
+                         time_interval=TimeInterval.ONE_DAY):
+    """
+    Run several screeners concurrently.
+
+    :param screeners: Screeners to run
+    :param limit: Maximum number of requests in flight at the same time
+    :param session: Async HTTP session shared by the requests (default is a session opened for this call only)
+    :param time_interval: The time interval for the data (default is ONE_DAY).
+    :return: List of ScreenerDataFrame, in the same order as the screeners
+    :raises MalformedRequestException: If one of the API requests fails
+    """
+    import asyncio
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _get(screener, session_):
+        async with semaphore:
+            return await screener.aget(time_interval, session=session_)
+
+    if session is None:
+        async with AsyncScreenerSession(limit=limit) as session:
+            return await asyncio.gather(*(_get(screener, session) for screener in screeners))
+    return await asyncio.gather(*(_get(screener, session) for screener in screeners))
+
+
+def __getattr__(name):
+    # ScreenerDataFrame lives in tvscreener.core.dataframe, so that the screeners can be used without pandas
+    if name == "ScreenerDataFrame":
+        from tvscreener.core.dataframe import ScreenerDataFrame
+        return ScreenerDataFrame
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,14 @@
 from tvscreener.core.base import Screener, default_sort_crypto
 from tvscreener.field.crypto import CryptoField
+from tvscreener.session import ScreenerSession
 from tvscreener.util import get_url
 
 
 class CryptoScreener(Screener):
     """Crypto screener for querying cryptocurrencies from TradingView."""
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, session: ScreenerSession = None):
+        super().__init__(session)
         subtype = "crypto"
         self.markets = {subtype}  # Fixed: set literal instead of set(string)
         self.url = get_url(subtype)
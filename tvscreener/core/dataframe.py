@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+
+from tvscreener.util import order_columns
+
+# Configuration constants
+MAX_INSERTED_COLUMNS = 50  # non-float columns inserted one by one around the float block
+
+
+class ScreenerDataFrame(pd.DataFrame):
+    """
+    Screener results, with the technical name of each column kept in attrs['original_columns'].
+
+    The class and its attrs are kept by the frames that pandas derives from it (selections, copies, astype...).
+    """
+
+    @property
+    def _constructor(self):
+        return ScreenerDataFrame
+
+    def __init__(self, data=None, *args, **kwargs):
+        columns = args[0] if args else kwargs.get("columns")
+        if not isinstance(columns, dict):
+            # Built by pandas from another frame, e.g. ScreenerDataFrame(data, index=..., columns=[...]): passed through
+            super().__init__(data, *args, **kwargs)
+            return
+        args, kwargs = args[1:], {k: v for k, v in kwargs.items() if k != "columns"}
+
+        # Add the extra received columns, and put the symbol, name and description first
+        columns = {"symbol": "Symbol", **columns}
+        ordered_columns = order_columns(columns)
+
+        labels = list(ordered_columns.values())
+        # Multi time interval results have (label, time interval) columns
+        if any(isinstance(label, tuple) for label in labels):
+            ordered_columns = {k: v if isinstance(v, tuple) else (v, "") for k, v in ordered_columns.items()}
+            labels = pd.MultiIndex.from_tuples(ordered_columns.values(), names=[None, "interval"])
+
+        if not isinstance(data, dict):
+            # Rows, in the order of the columns
+            data = dict(zip(columns, zip(*data))) if len(data) else \
+                {k: np.empty(0, dtype=object) for k in columns}
+        # Built in the final column order, so that the data is not copied again to reorder it. The float columns are
+        # stacked into a single block and the other columns inserted around it: from interleaved dtypes, pandas would
+        # build several blocks and copy them again to consolidate them
+        float_columns = {k for k in ordered_columns if getattr(data[k], "dtype", None) == np.float64}
+        if not float_columns or len(ordered_columns) - len(float_columns) > MAX_INSERTED_COLUMNS:
+            super().__init__({k: data[k] for k in ordered_columns}, *args, **kwargs)
+        else:
+            super().__init__({k: data[k] for k in ordered_columns if k in float_columns},
+                             index=pd.RangeIndex(len(data["symbol"])), *args, **kwargs)
+            for loc, k in enumerate(ordered_columns):
+                if k not in float_columns:
+                    self.insert(loc, k, data[k])
+        self.columns = labels
+        self.attrs['original_columns'] = ordered_columns
+
+    def set_technical_columns(self, only: bool = False):
+        original_columns = self.attrs['original_columns']
+        labels = {v: k for k, v in original_columns.items()}
+        # Looked up from the current columns, so that it also works on a selection of the columns and when the
+        # technical columns are already set
+        technical_columns = [labels[column] if column in labels else
+                             column if column in original_columns else column[0] for column in self.columns]
+        if only:
+            self.columns = pd.Index(technical_columns)
+        else:
+            self.columns = pd.MultiIndex.from_tuples(
+                (k, *v) if isinstance(v, tuple) else (k, v) for k, v in
+                ((k, original_columns[k]) for k in technical_columns))
@@ -1,13 +1,14 @@
 from tvscreener.core.base import Screener, default_sort_forex
 from tvscreener.field.forex import ForexField
+from tvscreener.session import ScreenerSession
 from tvscreener.util import get_url
 
 
 class ForexScreener(Screener):
     """Forex screener for querying forex/currency pairs from TradingView."""
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, session: ScreenerSession = None):
+        super().__init__(session)
         subtype = "forex"
         self.url = get_url(subtype)
         self.markets = {subtype}  # Fixed: set literal instead of set(string)
@@ -1,7 +1,11 @@
-from tvscreener.core.base import Screener, default_market, default_sort_stocks
-from tvscreener.field import Market, Type, SymbolType
+from concurrent.futures import ThreadPoolExecutor
+
+from tvscreener.core.base import Screener, default_market, default_sort_stocks, DEFAULT_CONCURRENCY, \
+    DEFAULT_PAGE_SIZE, DEFAULT_PREFETCH
+from tvscreener.field import Market, Type, SymbolType, TimeInterval
 from tvscreener.field.stock import StockField
 from tvscreener.filter import FilterOperator
+from tvscreener.session import ScreenerSession, AsyncScreenerSession
 from tvscreener.util import get_url
 
 # Mapping from SymbolType to Type for efficient lookup
@@ -21,9 +25,10 @@ SYMBOL_TYPE_TO_TYPE_MAP = {
 class StockScreener(Screener):
     """Stock screener for querying stocks from TradingView."""
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, session: ScreenerSession = None):
+        super().__init__(session)
         self.markets = [default_market]
+        self.fan_out = False
         self.url = get_url("global")
         self.specific_fields = StockField
         self.sort_by(default_sort_stocks, False)
@@ -72,13 +77,145 @@ class StockScreener(Screener):
         for symbol_type in symbol_types_list:
             self.add_filter(StockField.SUBTYPE, FilterOperator.IN_RANGE, symbol_type.value.copy())
 
-    def set_markets(self, *markets: Market):
+    def set_markets(self, *markets: Market, fan_out: bool = False):
         """
         Set the markets to be scanned
         :param markets: list of markets
+        :param fan_out: If True, each market is requested separately and concurrently, and the results are merged
+            with a "Market" column added
         :return: None
         """
         if Market.ALL in markets:
             self.markets = [market for market in Market]
         else:
             self.markets = [market for market in markets]
+        self.fan_out = fan_out
+
+    def _get_fan_out_markets(self):
+        """Return the markets requested one by one, or None if they are requested together."""
+        markets = [market for market in self.markets if market != Market.ALL]
+        return markets if self.fan_out and len(markets) > 1 else None
+
+    def _check_no_fan_out(self, method):
+        """
+        :raises ValueError: If the markets are fanned out, which the paginated methods do not support
+        """
+        if self._get_fan_out_markets() is not None:
+            raise ValueError(f"{method} does not support fan_out, use get or aget, or set_markets without fan_out")
+
+    def _prepare_fan_out(self, time_interval, markets, print_request):
+        """Return the columns and the payloads of the markets, one request per market."""
+        columns, _ = self._prepare_request(time_interval)
+        payloads = [self._prepare_request(time_interval, markets=[market.value])[1] for market in markets]
+        if print_request:
+            self._print_request(payloads[0])
+        return columns, payloads
+
+    def get(self, time_interval=TimeInterval.ONE_DAY, print_request=False, dtypes=None, backend="pandas"):
+        """
+        Get the screener data from TradingView, with one concurrent request per market if fan_out is set.
+
+        :param time_interval: The time interval for the data (default is ONE_DAY).
+        :param print_request: If True, prints the request URL and payload for debugging.
+        :param dtypes: "compact" for memory-compact dtypes, see Screener.get
+        :param backend: "pandas", "arrow", "polars" or "records", see Screener.get
+        :return: ScreenerDataFrame containing the screener results, or a pyarrow Table, polars DataFrame or records
+        :raises MalformedRequestException: If the API request fails
+        """
+        markets = self._get_fan_out_markets()
+        if markets is None:
+            return super().get(time_interval, print_request, dtypes, backend)
+
+        self._check_result_options(dtypes, backend)
+
+        # One request per market: each response stays small and the requests run in parallel
+        columns, payloads = self._prepare_fan_out(time_interval, markets, print_request)
+
+        # Cached as a whole, keyed on all the payloads
+        cache_key, df = self._cache_get("\n".join(payloads), backend)
+        if df is None:
+            with ThreadPoolExecutor(max_workers=DEFAULT_CONCURRENCY) as executor:
+                pages = list(executor.map(self._post, payloads))
+            df = self._merge_markets(markets, pages, columns, backend)
+            self._cache_set(cache_key, df, time_interval)
+        return self._apply_dtypes(df, dtypes)
+
+    async def aget(self, time_interval=TimeInterval.ONE_DAY, print_request=False,
+                   session: AsyncScreenerSession = None, dtypes=None, backend="pandas"):
+        """
+        Get the screener data from TradingView without blocking the event loop, with one concurrent request per
+        market if fan_out is set.
+
+        :param time_interval: The time interval for the data (default is ONE_DAY).
+        :param print_request: If True, prints the request URL and payload for debugging.
+        :param session: Async HTTP session to use (default is a session opened for this call only)
+        :param dtypes: "compact" for memory-compact dtypes, see Screener.get
+        :param backend: "pandas", "arrow", "polars" or "records", see Screener.get
+        :return: ScreenerDataFrame containing the screener results, or a pyarrow Table, polars DataFrame or records
+        :raises MalformedRequestException: If the API request fails
+        """
+        markets = self._get_fan_out_markets()
+        if markets is None:
+            return await super().aget(time_interval, print_request, session, dtypes, backend)
+
+        self._check_result_options(dtypes, backend)
+        columns, payloads = self._prepare_fan_out(time_interval, markets, print_request)
+
+        cache_key, df = self._cache_get("\n".join(payloads), backend)
+        if df is None:
+            if session is None:
+                async with AsyncScreenerSession(limit=DEFAULT_CONCURRENCY) as session:
+                    pages = await self._apost_all(payloads, session)
+            else:
+                pages = await self._apost_all(payloads, session)
+            df = self._merge_markets(markets, pages, columns, backend)
+            self._cache_set(cache_key, df, time_interval)
+        return self._apply_dtypes(df, dtypes)
+
+    async def _apost_all(self, payloads, session):
+        """Send the payloads concurrently, DEFAULT_CONCURRENCY at most at the same time, and return the responses."""
+        import asyncio
+        semaphore = asyncio.Semaphore(DEFAULT_CONCURRENCY)
+
+        async def _apost(payload_json):
+            async with semaphore:
+                return await self._apost(payload_json, session)
+
+        return await asyncio.gather(*(_apost(payload_json) for payload_json in payloads))
+
+    def _merge_markets(self, markets, pages, columns, backend):
+        """Merge the responses of the markets, in the order of the markets, with a "Market" column added."""
+        data = [{"s": d["s"], "d": d["d"] + [market.value]} for market, page in zip(markets, pages)
+                for d in page['data']]
+        return self._to_result({'data': data}, {**columns, "market": "Market"}, backend=backend)
+
+    def get_all(self, time_interval=TimeInterval.ONE_DAY, page_size: int = DEFAULT_PAGE_SIZE,
+                max_workers: int = DEFAULT_CONCURRENCY, print_request=False, dtypes=None, backend="pandas"):
+        """
+        See Screener.get_all, the markets being requested together.
+
+        :raises ValueError: If fan_out is set
+        """
+        self._check_no_fan_out("get_all")
+        return super().get_all(time_interval, page_size, max_workers, print_request, dtypes, backend)
+
+    def iter_pages(self, time_interval=TimeInterval.ONE_DAY, page_size: int = DEFAULT_PAGE_SIZE,
+                   prefetch: int = DEFAULT_PREFETCH, print_request=False, dtypes=None, backend="pandas"):
+        """
+        See Screener.iter_pages, the markets being requested together.
+
+        :raises ValueError: If fan_out is set
+        """
+        self._check_no_fan_out("iter_pages")
+        return super().iter_pages(time_interval, page_size, prefetch, print_request, dtypes, backend)
+
+    def aiter_pages(self, time_interval=TimeInterval.ONE_DAY, page_size: int = DEFAULT_PAGE_SIZE,
+                    prefetch: int = DEFAULT_PREFETCH, print_request=False, dtypes=None, backend="pandas",
+                    session: AsyncScreenerSession = None):
+        """
+        See Screener.aiter_pages, the markets being requested together.
+
+        :raises ValueError: If fan_out is set
+        """
+        self._check_no_fan_out("aiter_pages")
+        return super().aiter_pages(time_interval, page_size, prefetch, print_request, dtypes, backend, session)
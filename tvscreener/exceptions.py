@@ -1,5 +1,9 @@
 class MalformedRequestException(Exception):
     def __init__(self, code, response_msg, url, payload):
+        self.code = code
+        self.response_msg = response_msg
+        self.url = url
+        self.payload = payload
         message = f"Error: {code}: {response_msg}\n"
         message += f"Request: {url}\n"
         message += "Payload:\n"
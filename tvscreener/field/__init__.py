@@ -1,5 +1,7 @@
 import math
+import re
 from enum import Enum
+from functools import lru_cache
 
 
 def add_time_interval(field_name, time_interval):
@@ -41,10 +43,57 @@ class Field(Enum):
 
     @classmethod
     def get_by_label(cls, specific_fields, label):
-        for specific_field in specific_fields:
-            if specific_field.label == label:
-                return specific_field
-        return None
+        return specific_fields.from_label(label)
+
+    @classmethod
+    def from_label(cls, label: str):
+        """
+        Return the field with the given label, e.g. 'Relative Strength Index (14)', or None if there is none.
+        """
+        return _get_indexes(cls)[0].get(label)
+
+    @classmethod
+    def from_field_name(cls, field_name: str):
+        """
+        Return the field of a technical column, e.g. 'RSI', 'RSI|60', 'Rec.Stoch.RSI.K', 'close[1]' or 'change|1W'.
+
+        :param field_name: field name, possibly with a time interval, a recommendation or a history suffix
+        :return: the field, or None if the column does not match any field
+        """
+        columns = _get_indexes(cls)[3]
+        try:
+            return columns[field_name]
+        except KeyError:
+            pass
+        column = field_name[len("Rec."):] if field_name.startswith("Rec.") else field_name
+        column = re.sub(r"\[\d+]", "", column)
+        fields_by_name = _get_indexes(cls)[1]
+        field = next((fields_by_name[candidate] for candidate in (column, column.replace("|", "."), column.split("|")[0])
+                      if candidate in fields_by_name), None)
+        # Memoized, the columns of the results being a small set
+        columns[field_name] = field
+        return field
+
+    @classmethod
+    def from_format(cls, format_: str | None) -> tuple:
+        """
+        Return the fields with the given format, e.g. 'percent', in the order of their definition.
+        """
+        return _get_indexes(cls)[2].get(format_, ())
+
+
+@lru_cache(maxsize=None)
+def _get_indexes(fields_):
+    """
+    Build the lookup indexes of a type of fields: by label, by field name, by format, and the memoized columns.
+    The first field wins when several ones share a label or a field name.
+    """
+    by_label, by_field_name, by_format = {}, {}, {}
+    for field in fields_:
+        by_label.setdefault(field.label, field)
+        by_field_name.setdefault(field.field_name, field)
+        by_format.setdefault(field.format, []).append(field)
+    return by_label, by_field_name, {format_: tuple(fields) for format_, fields in by_format.items()}, {}
 
 
 class Type(Enum):
@@ -81,6 +130,36 @@ class Rating(Enum):
                     return rating
         return Rating.UNKNOWN
 
+    @classmethod
+    def classify(cls, values):
+        """
+        Classify ratings all at once, as Rating.find does value by value.
+
+        The ratings are binned against the minimums of the ratings: a value on the boundary of two ratings belongs to
+        the higher one, the first one found by Rating.find. The missing values and the values out of [-1, 1] are
+        UNKNOWN.
+
+        :param values: Series, array or list of ratings
+        :return: Categorical of the rating labels (a categorical Series with the same index for a Series)
+        """
+        # Imported here, so that importing the fields does not import numpy and pandas
+        import numpy as np
+        import pandas as pd
+        ratings = sorted((rating for rating in cls if rating != cls.UNKNOWN), key=lambda rating: rating.min)
+        edges = np.array([rating.min for rating in ratings])
+        labels = [rating.label for rating in cls]
+        codes_by_bin = np.array([labels.index(rating.label) for rating in ratings])
+
+        array = np.asarray(values, dtype=np.float64)
+        # The maximum of the highest rating belongs to it
+        bins = np.minimum(np.digitize(array, edges), len(ratings)) - 1
+        known = (array >= ratings[0].min) & (array <= ratings[-1].max)
+        codes = np.where(known, codes_by_bin[bins.clip(0)], labels.index(cls.UNKNOWN.label))
+        categorical = pd.Categorical.from_codes(codes, categories=labels)
+        if isinstance(values, pd.Series):
+            return pd.Series(categorical, index=values.index, name=values.name)
+        return categorical
+
     @classmethod
     def names(cls):
         return list(map(lambda c: c.name, cls))
@@ -0,0 +1,75 @@
+import importlib.util
+import json
+
+# Configuration constants
+JSON_BACKENDS = ("json", "orjson", "msgspec")
+AUTO = "auto"  # fastest installed backend
+
+
+def _import_orjson():
+    try:
+        import orjson
+    except ImportError as e:
+        raise ImportError("The orjson JSON backend requires orjson: pip install tvscreener[orjson]") from e
+    return orjson
+
+
+def _import_msgspec():
+    try:
+        import msgspec.json
+    except ImportError as e:
+        raise ImportError("The msgspec JSON backend requires msgspec: pip install tvscreener[msgspec]") from e
+    return msgspec
+
+
+def resolve_json_backend(name: str) -> str:
+    """
+    Return the JSON backend to use for the given name.
+
+    :param name: "json", "orjson", "msgspec", or "auto" for the fastest installed one
+    :return: name of the backend
+    :raises ValueError: If the backend is unknown
+    :raises ImportError: If the backend is not installed
+    """
+    if name == AUTO:
+        return next((backend for backend in ("orjson", "msgspec") if importlib.util.find_spec(backend) is not None),
+                    "json")
+    if name not in JSON_BACKENDS:
+        raise ValueError(f"Unknown JSON backend: {name}, expected one of {(*JSON_BACKENDS, AUTO)}")
+    if name == "orjson":
+        _import_orjson()
+    elif name == "msgspec":
+        _import_msgspec()
+    return name
+
+
+def dumps(obj, backend: str = "json", indent: int = None) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    :param obj: Object to serialize
+    :param backend: "json", "orjson" or "msgspec"
+    :param indent: Indentation of a pretty-printed output, always produced by the json module, or None for a compact
+        output without whitespace
+    """
+    if indent is not None:
+        return json.dumps(obj, indent=indent)
+    if backend == "orjson":
+        return _import_orjson().dumps(obj).decode()
+    if backend == "msgspec":
+        return _import_msgspec().json.encode(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def loads(data: bytes | str, backend: str = "json"):
+    """
+    Deserialize a JSON document.
+
+    :param data: JSON document, as bytes or as a string
+    :param backend: "json", "orjson" or "msgspec"
+    """
+    if backend == "orjson":
+        return _import_orjson().loads(data)
+    if backend == "msgspec":
+        return _import_msgspec().json.decode(data)
+    return json.loads(data)
@@ -0,0 +1,190 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from tvscreener.exceptions import MalformedRequestException
+
+# Configuration constants
+DEFAULT_POOL_CONNECTIONS = 4  # number of hosts kept in the pool
+DEFAULT_POOL_MAXSIZE = 16  # keep-alive connections kept per host
+WARMUP_TIMEOUT = 10  # seconds
+DEFAULT_KEEPALIVE_TIMEOUT = 30  # seconds an idle async connection is kept open
+
+_default_session = None
+_default_session_lock = threading.Lock()
+
+
+class ScreenerSession:
+    """
+    Pooled, keep-alive HTTP session used by the screeners.
+
+    Connections to the scanner are reused between requests, so only the first request to a host pays the TCP and TLS
+    handshake. A single session is thread-safe and can be shared by any number of screeners.
+    """
+
+    def __init__(self, pool_connections: int = DEFAULT_POOL_CONNECTIONS, pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 pool_block: bool = False, max_retries: int = 0):
+        """
+        :param pool_connections: Number of per-host connection pools to cache
+        :param pool_maxsize: Maximum number of keep-alive connections kept open per host
+        :param pool_block: If True, requests wait for a free connection instead of opening extra ones
+        :param max_retries: Number of retries on connection errors
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+
+        self.session = requests.Session()
+        self.session.headers.update({'Content-Type': 'application/json', 'Connection': 'keep-alive'})
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                              pool_block=pool_block, max_retries=max_retries)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def post(self, url, data, timeout=None, headers=None, stream=False):
+        """
+        Post the data and return the response.
+
+        :param stream: If True, the body is not downloaded until it is read, e.g. with response.iter_content
+        """
+        return self.session.post(url, data=data, timeout=timeout, headers=headers, stream=stream)
+
+    def warmup(self, url, connections: int = 1) -> int:
+        """
+        Pre-open keep-alive connections to the host of the given url, e.g. before market open.
+
+        :param url: Url of the host to connect to
+        :param connections: Number of connections to open (capped by pool_maxsize)
+        :return: Number of connections successfully opened
+        """
+        connections = max(1, min(connections, self.pool_maxsize))
+
+        def _open(_):
+            try:
+                self.session.head(url, timeout=WARMUP_TIMEOUT)
+                return True
+            except requests.RequestException:
+                return False
+
+        # Requests are issued concurrently so that each one checks out its own connection from the pool
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            return sum(executor.map(_open, range(connections)))
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _import_aiohttp():
+    try:
+        import aiohttp
+    except ImportError as e:
+        raise ImportError("The async API requires aiohttp: pip install tvscreener[async]") from e
+    return aiohttp
+
+
+def _to_text(data):
+    return data.decode(errors="replace") if isinstance(data, bytes) else data
+
+
+class AsyncScreenerSession:
+    """
+    Pooled, keep-alive async HTTP session used by Screener.aget and gather_screens.
+
+    The underlying aiohttp session is opened on first use, inside the running event loop, and must be closed with
+    close() or by using the session as an async context manager.
+    """
+
+    def __init__(self, limit: int = DEFAULT_POOL_MAXSIZE, limit_per_host: int = DEFAULT_POOL_MAXSIZE,
+                 keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT):
+        """
+        :param limit: Maximum number of simultaneous connections
+        :param limit_per_host: Maximum number of simultaneous connections per host
+        :param keepalive_timeout: Seconds an idle connection is kept open
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.session = None
+
+    def _get_session(self):
+        if self.session is None or self.session.closed:
+            aiohttp = _import_aiohttp()
+            connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host,
+                                             keepalive_timeout=self.keepalive_timeout)
+            self.session = aiohttp.ClientSession(connector=connector, headers={'Content-Type': 'application/json'})
+        return self.session
+
+    async def post(self, url, data, timeout=None, headers=None):
+        """
+        Post the data and return the status code and the raw body of the response.
+
+        :raises MalformedRequestException: If there's a network error or a timeout
+        """
+        # Imported here, asyncio is only needed by the async API
+        import asyncio
+        aiohttp = _import_aiohttp()
+        session = self._get_session()
+        try:
+            async with session.post(url, data=data, headers=headers,
+                                    timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                return response.status, await response.read()
+        except asyncio.TimeoutError:
+            raise MalformedRequestException(408, f"Request timed out after {timeout} seconds", url, _to_text(data))
+        except aiohttp.ClientError as e:
+            raise MalformedRequestException(0, str(e), url, _to_text(data))
+
+    async def warmup(self, url, connections: int = 1) -> int:
+        """
+        Pre-open keep-alive connections to the host of the given url.
+
+        :param url: Url of the host to connect to
+        :param connections: Number of connections to open (capped by limit_per_host)
+        :return: Number of connections successfully opened
+        """
+        import asyncio
+        aiohttp = _import_aiohttp()
+        session = self._get_session()
+        connections = max(1, min(connections, self.limit_per_host))
+
+        async def _open():
+            try:
+                async with session.head(url, timeout=aiohttp.ClientTimeout(total=WARMUP_TIMEOUT)):
+                    return True
+            except (asyncio.TimeoutError, aiohttp.ClientError):
+                return False
+
+        return sum(await asyncio.gather(*(_open() for _ in range(connections))))
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+
+def get_default_session() -> ScreenerSession:
+    """Return the session shared by all screeners created without an explicit session."""
+    global _default_session
+    with _default_session_lock:
+        if _default_session is None:
+            _default_session = ScreenerSession()
+        return _default_session
+
+
+def set_default_session(session: ScreenerSession) -> None:
+    """Replace the session shared by all screeners created without an explicit session."""
+    global _default_session
+    with _default_session_lock:
+        _default_session = session
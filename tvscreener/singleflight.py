@@ -0,0 +1,119 @@
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesce identical concurrent calls: while a call for a key is in flight, the other calls for the same key wait
+    for it and share its result (or its exception) instead of running again.
+
+    The same group can be used by threads (do) and by coroutines (ado).
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.executions = 0
+        self.shared = 0
+
+        self._calls = {}  # key -> _Call
+        self._futures = {}  # (event loop, key) -> asyncio.Future
+        self._lock = threading.Lock()
+
+    def do(self, key, fn, *args):
+        """
+        Call fn(*args), unless a call for the same key is already in flight, in which case wait for its result.
+        """
+        with self._lock:
+            self.calls += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+    async def ado(self, key, coroutine_fn, *args):
+        """
+        Await coroutine_fn(*args), unless a call for the same key is already in flight in the running event loop,
+        in which case wait for its result.
+
+        The call runs in its own task, awaited by all the callers through a shield: a cancelled caller, the first one
+        included, does not cancel the others. The task is only cancelled when no caller is left waiting for it.
+        """
+        # Imported here, asyncio is only needed by the async API
+        import asyncio
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self.calls += 1
+            call = self._futures.get((loop, key))
+            if call is None:
+                task = asyncio.ensure_future(coroutine_fn(*args))
+                call = self._futures[(loop, key)] = [task, 0]  # task, number of callers waiting for it
+                task.add_done_callback(lambda _: self._forget(loop, key, call))
+                self.executions += 1
+            else:
+                self.shared += 1
+            call[1] += 1
+
+        task = call[0]
+        try:
+            return await asyncio.shield(task)
+        finally:
+            with self._lock:
+                call[1] -= 1
+                abandoned = call[1] == 0 and not task.done()
+            if abandoned:
+                # The next callers start a new call instead of waiting for the cancelled one
+                self._forget(loop, key, call)
+                task.cancel()
+
+    def _forget(self, loop, key, call):
+        with self._lock:
+            if self._futures.get((loop, key)) is call:
+                del self._futures[(loop, key)]
+        task = call[0]
+        if task.done() and not task.cancelled():
+            # Mark the exception as retrieved when no caller was left waiting for it
+            task.exception()
+
+    def __reduce__(self):
+        # Pickled without the calls in flight and their lock: the default group is restored as the default group of
+        # the process that loads it, e.g. a multiprocessing worker, another group as a new empty group
+        if self is _default_single_flight:
+            return get_default_single_flight, ()
+        return SingleFlight, ()
+
+    def stats(self) -> dict:
+        return {"calls": self.calls, "executions": self.executions, "shared": self.shared}
+
+
+_default_single_flight = SingleFlight()
+
+
+def get_default_single_flight() -> SingleFlight:
+    """Return the group coalescing the requests of all screeners created without an explicit group."""
+    return _default_single_flight
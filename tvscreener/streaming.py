@@ -0,0 +1,178 @@
+import codecs
+import json
+import re
+from itertools import chain
+
+from tvscreener.util import decode_columns
+
+# Configuration constants
+DEFAULT_CHUNK_SIZE = 64 * 1024  # bytes read from the response at a time
+DEFAULT_BATCH_SIZE = 1000  # rows transposed into columns at a time
+
+_JSON_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class StreamDecoder:
+    """
+    Incremental decoder of a /scan response into columns.
+
+    The rows of the "data" array are parsed as the chunks of the body arrive and transposed into columns by batches,
+    so that neither the whole body nor the Python objects of all the rows are held in memory at once.
+    """
+
+    def __init__(self, width: int, batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        :param width: Number of values per row
+        :param batch_size: Number of rows transposed into columns at a time
+        """
+        self.width = width
+        self.batch_size = batch_size
+        self.result = {}  # members of the response other than data, e.g. totalCount
+
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._text = ""
+        self._pos = 0
+        self._state = "start"
+        self._key = None
+        self._pending = 0  # length of the incomplete value at the end of the buffer
+        self._rows = []
+        self._batches = []
+
+    def feed(self, chunk: bytes) -> None:
+        """Parse the next chunk of the body."""
+        self._text = self._text[self._pos:] + self._utf8.decode(chunk)
+        self._pos = 0
+        self._parse(final=False)
+
+    def close(self) -> dict:
+        """
+        Parse the end of the body and return the response, the data being given as columns.
+
+        :return: dict of the members of the response, with a "columns" list instead of the "data" rows: the symbols
+            first and then one column per value, as returned by decode_columns
+        :raises ValueError: If the body is not a complete JSON object
+        """
+        self._text = self._text[self._pos:] + self._utf8.decode(b"", final=True)
+        self._pos = 0
+        self._parse(final=True)
+        if self._state != "end":
+            raise ValueError("Incomplete JSON response")
+        self._flush()
+        return {**self.result, "columns": _merge_batches(self._batches, self.width)}
+
+    def _next_char(self):
+        self._pos = _WHITESPACE.match(self._text, self._pos).end()
+        return self._text[self._pos] if self._pos < len(self._text) else None
+
+    def _decode_value(self, final):
+        available = len(self._text) - self._pos
+        # An incomplete value is only parsed again once the buffer has doubled, which keeps the parsing linear
+        if available < 2 * self._pending and not final:
+            return False, None
+        try:
+            value, end = _JSON_DECODER.raw_decode(self._text, self._pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            self._pending = available
+            return False, None
+        # A number at the end of the buffer may continue in the next chunk
+        if end == len(self._text) and not final:
+            self._pending = available
+            return False, None
+        self._pos = end
+        self._pending = 0
+        return True, value
+
+    def _parse(self, final):
+        while True:
+            char = self._next_char()
+            if char is None:
+                return
+            if self._state == "start":
+                self._expect(char, "{")
+                self._state = "key"
+            elif self._state == "key":
+                if char == "}":
+                    self._pos += 1
+                    self._state = "end"
+                    continue
+                complete, self._key = self._decode_value(final)
+                if not complete:
+                    return
+                self._state = "colon"
+            elif self._state == "colon":
+                self._expect(char, ":")
+                self._state = "data" if self._key == "data" else "value"
+            elif self._state == "value":
+                complete, value = self._decode_value(final)
+                if not complete:
+                    return
+                self.result[self._key] = value
+                self._state = "next_key"
+            elif self._state == "next_key":
+                if char == "}":
+                    self._pos += 1
+                    self._state = "end"
+                else:
+                    self._expect(char, ",")
+                    self._state = "key"
+            elif self._state == "data":
+                self._expect(char, "[")
+                self._state = "row"
+            elif self._state == "row":
+                if char == "]":
+                    self._pos += 1
+                    self._state = "next_key"
+                    continue
+                complete, row = self._decode_value(final)
+                if not complete:
+                    return
+                self._rows.append(row)
+                if len(self._rows) >= self.batch_size:
+                    self._flush()
+                self._state = "next_row"
+            elif self._state == "next_row":
+                if char == "]":
+                    self._pos += 1
+                    self._state = "next_key"
+                else:
+                    self._expect(char, ",")
+                    self._state = "row"
+            else:
+                raise ValueError(f"Unexpected data after the end of the JSON response: {char!r}")
+
+    def _expect(self, char, expected):
+        if char != expected:
+            raise ValueError(f"Malformed JSON response: expected {expected!r}, got {char!r}")
+        self._pos += 1
+
+    def _flush(self):
+        if self._rows:
+            self._batches.append(decode_columns(self._rows, self.width))
+            self._rows = []
+
+
+def _is_missing(column):
+    return not hasattr(column, "dtype") and all(value is None for value in column)
+
+
+def _merge_batches(batches, width):
+    if not batches:
+        return decode_columns([], width)
+    if len(batches) == 1:
+        return batches[0]
+
+    import numpy as np
+    columns = []
+    for chunks in zip(*batches):
+        # Float columns stay arrays, a batch holding only missing values being a batch of NaN
+        if all(hasattr(chunk, "dtype") or _is_missing(chunk) for chunk in chunks) and \
+                any(hasattr(chunk, "dtype") for chunk in chunks):
+            columns.append(np.concatenate([chunk if hasattr(chunk, "dtype") else np.full(len(chunk), np.nan)
+                                           for chunk in chunks]))
+        else:
+            columns.append(list(chain.from_iterable(
+                chunk.tolist() if hasattr(chunk, "dtype") else chunk for chunk in chunks)))
+    return columns
@@ -1,9 +1,26 @@
+import importlib.util
 import math
+from functools import lru_cache
 from typing import Type
 
 from tvscreener.field import Field, TimeInterval, add_historical, add_time_interval, add_rec, add_rec_to_label, \
     add_historical_to_label
 
+# Configuration constants
+COLUMNS_CACHE_SIZE = 256  # column plans kept, one per type of fields, time interval and selection of fields
+
+
+class FrozenDict(dict):
+    """dict that cannot be modified, so that a memoized result can be shared by all its callers."""
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is immutable, copy it with dict() to modify it")
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _immutable
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
 
 def format_historical_field(field_, time_interval, historical=1):
     """
@@ -25,13 +42,22 @@ def format_historical_field(field_, time_interval, historical=1):
     return formatted_technical_field
 
 
-def get_columns_to_request(fields_: Type[Field], time_interval: TimeInterval):
+def get_columns_to_request(fields_: Type[Field], time_interval: TimeInterval, selected_fields=None):
     """
     Assemble the technical columns for the request
     :param fields_: type of fields to be requested (StockField, ForexField, CryptoField)
     :param time_interval:
-    :return:
+    :param selected_fields: fields to restrict the request to (default is all the fields)
+    :return: FrozenDict of technical column and label, computed once per arguments
     """
+    return _get_columns_to_request(fields_, time_interval,
+                                   None if selected_fields is None else frozenset(selected_fields))
+
+
+@lru_cache(maxsize=COLUMNS_CACHE_SIZE)
+def _get_columns_to_request(fields_, time_interval, selected_fields):
+    if selected_fields is not None:
+        fields_ = [field for field in fields_ if field in selected_fields]
 
     # Build a dict of technical label and field label
     # Format the technical field to the time interval
@@ -59,11 +85,42 @@ def get_columns_to_request(fields_: Type[Field], time_interval: TimeInterval):
                     for field in fields_ if field.historical}
 
     # Merge the dicts
-    columns = {**columns, **rec_columns, **hist_columns}
+    columns = FrozenDict({**columns, **rec_columns, **hist_columns})
 
     return columns
 
 
+def get_columns_to_request_by_interval(fields_: Type[Field], time_intervals, selected_fields=None):
+    """
+    Assemble the technical columns for a request covering several time intervals
+    :param fields_: type of fields to be requested (StockField, ForexField, CryptoField)
+    :param time_intervals: list of time intervals
+    :param selected_fields: fields to restrict the request to (default is all the fields)
+    :return: FrozenDict of technical column and (label, time interval value), the time interval value being empty for
+        the columns that do not depend on the time interval, computed once per arguments
+    """
+    return _get_columns_to_request_by_interval(fields_, tuple(time_intervals),
+                                               None if selected_fields is None else frozenset(selected_fields))
+
+
+@lru_cache(maxsize=COLUMNS_CACHE_SIZE)
+def _get_columns_to_request_by_interval(fields_, time_intervals, selected_fields):
+    columns_by_interval = {time_interval: get_columns_to_request(fields_, time_interval, selected_fields)
+                           for time_interval in time_intervals}
+
+    # A column does not depend on the time interval when its technical name is the same for every time interval
+    probe = TimeInterval.ONE_MINUTE if TimeInterval.ONE_DAY in columns_by_interval else TimeInterval.ONE_DAY
+    independent_columns = set(get_columns_to_request(fields_, probe, selected_fields))
+    independent_columns = independent_columns.intersection(*columns_by_interval.values())
+
+    columns = {}
+    for time_interval, interval_columns in columns_by_interval.items():
+        for column, label in interval_columns.items():
+            if column not in columns:
+                columns[column] = (label, "" if column in independent_columns else time_interval.value)
+    return FrozenDict(columns)
+
+
 def _format_timed_fields(field_):
     """Format fields that embed the time interval in the name
     e.g. 'change.1W' -> 'change|1W'"""
@@ -78,6 +135,151 @@ def _format_timed_fields(field_):
     return field_
 
 
+def order_columns(columns):
+    """
+    Add the symbol column and put the symbol, name and description first
+    :param columns: dict of technical column and label, in the order of the request
+    :return: dict of technical column and label, in the order of the result
+    """
+    columns = {"symbol": "Symbol", **columns}
+    first_columns = ['symbol', 'name', 'description']
+    ordered_columns = {k: columns[k] for k in first_columns if k in columns}
+    ordered_columns.update({k: v for k, v in columns.items() if k not in first_columns})
+    return ordered_columns
+
+
+_NONE_TYPE = type(None)
+_NUMERIC_TYPES = {float, int, _NONE_TYPE}
+
+
+def _to_column(values):
+    import numpy as np
+    types = set(map(type, values))
+    # Numbers with missing values or floats: float64, as pandas would infer it but without the per-row overhead
+    if types <= _NUMERIC_TYPES and types != {int} and types != {_NONE_TYPE}:
+        return np.array(values, dtype=np.float64)
+    return list(values)
+
+
+def _is_float_column(values, first):
+    if type(first) is float:
+        return True
+    if first is None or type(first) is int:
+        types = set(map(type, values))
+        return float in types and types <= _NUMERIC_TYPES
+    return False
+
+
+def decode_columns(data, width):
+    """
+    Transpose the rows of a /scan response into columns.
+
+    The float columns are converted to float64 all at once, in the row-major order of the response. A column is a float
+    column when its first value is a float (or when its non-null values are floats), the scanner returning a single
+    JSON type per field. The other columns are returned as lists and left to the inference of pandas.
+
+    :param data: "data" array of the response, made of {"s": symbol, "d": [values]} rows
+    :param width: Number of values per row
+    :return: List of columns, the symbols first and then one column per value, float columns being float64 arrays
+    """
+    # numpy is only imported by the screeners decoding into columns
+    import numpy as np
+    symbols = [row["s"] for row in data]
+    rows = [row["d"] for row in data]
+    if not rows:
+        # Empty object columns, as pandas builds them from no rows
+        return [np.empty(0, dtype=object) for _ in range(width + 1)]
+
+    try:
+        values = np.array(rows, dtype=object)
+    except ValueError:
+        values = None
+    if values is None or values.ndim != 2:
+        # Ragged rows or array values: one column at a time
+        return [symbols] + [_to_column(column) for column in zip(*rows)]
+
+    float_columns = [j for j, first in enumerate(rows[0]) if _is_float_column(values[:, j], first)]
+    other_columns = sorted(set(range(values.shape[1])) - set(float_columns))
+    columns = {j: values[:, j].tolist() for j in other_columns}
+    values[:, other_columns] = np.nan
+    try:
+        block = values.astype(np.float64)
+    except (TypeError, ValueError):
+        return [symbols] + [_to_column(column) for column in zip(*rows)]
+    # Contiguous columns, so that each one is a single block
+    block = np.ascontiguousarray(block.T)
+    columns.update((j, block[j]) for j in float_columns)
+    return [symbols] + [columns[j] for j in range(values.shape[1])]
+
+
+def get_response_columns(response_json, width):
+    """
+    Return the columns of a /scan response, as returned by decode_columns.
+
+    :param response_json: Decoded JSON response, with its "data" rows or with the "columns" of a StreamDecoder
+    :param width: Number of values per row
+    """
+    if "columns" in response_json:
+        return response_json["columns"]
+    return decode_columns(response_json['data'], width)
+
+
+# Compact dtypes: float32 keeps about 7 significant digits, enough for prices, ratios and indicators but not for
+# volumes, share counts and timestamps, which stay float64
+FLOAT32_FORMATS = {"percent", "round", "float", "currency", "rating", "recommendation", "computed_recommendation"}
+CATEGORY_COLUMNS = {"sector", "industry", "exchange", "type", "subtype", "country", "currency",
+                    "fundamental_currency_code", "market", "update_mode"}
+STRING_COLUMNS = {"symbol", "name", "description", "logoid"}
+
+
+def get_field_by_column(fields_: Type[Field], column: str):
+    """
+    Find the field of a technical column, e.g. 'RSI|60', 'Rec.Stoch.RSI.K', 'close[1]' or 'change|1W'
+    :param fields_: type of fields (StockField, ForexField, CryptoField)
+    :param column: technical column
+    :return: the field, or None if the column does not match any field
+    """
+    return fields_.from_field_name(column)
+
+
+def _get_string_dtype():
+    # Arrow-backed strings when pyarrow is installed
+    if importlib.util.find_spec("pyarrow") is not None:
+        import pandas as pd
+        return pd.StringDtype("pyarrow")
+    return "string"
+
+
+def get_compact_dtypes(fields_: Type[Field], df):
+    """
+    Derive a memory-compact dtype for each column of a ScreenerDataFrame from the format of its field.
+
+    Numeric formats become float32 (except volumes, counts and dates), bool fields nullable booleans, low-cardinality
+    text fields categories and the symbol, name and description strings.
+    :param fields_: type of fields of the screener (StockField, ForexField, CryptoField)
+    :param df: ScreenerDataFrame to compact
+    :return: dict of column label and dtype, for the columns whose dtype changes
+    """
+    dtypes = {}
+    for i, (column, label, dtype) in enumerate(zip(df.attrs['original_columns'], df.columns, df.dtypes)):
+        base_column = column.split("|")[0]
+        field = get_field_by_column(fields_, column)
+        if dtype.kind not in "fiub":
+            if base_column in STRING_COLUMNS:
+                dtypes[label] = _get_string_dtype()
+            elif base_column in CATEGORY_COLUMNS:
+                dtypes[label] = "category"
+        elif field is None:
+            continue
+        elif field.format == "bool":
+            # Only 0/1 flags, anything else would not convert
+            if df.iloc[:, i].dropna().isin((0, 1)).all():
+                dtypes[label] = "boolean"
+        elif field.format in FLOAT32_FORMATS and dtype.kind == "f":
+            dtypes[label] = "float32"
+    return dtypes
+
+
 def is_status_code_ok(response):
     """Check if HTTP response status code indicates success."""
     return response.ok  # Simplified: use built-in ok property